@@ -364,10 +364,13 @@ class BlueBubblesClient:
 
     # Attachment endpoints
 
-    async def get_attachment(self, attachment_guid: str) -> bytes:
-        """Download an attachment by GUID."""
+    async def get_attachment(self, attachment_guid: str, timeout: float | None = None) -> bytes:
+        """Download an attachment by GUID, optionally overriding the request timeout."""
         url = self._build_url(f"attachment/{attachment_guid}/download")
-        response = await self.client.get(url)
+        if timeout is not None:
+            response = await self.client.get(url, timeout=httpx.Timeout(timeout, connect=10.0))
+        else:
+            response = await self.client.get(url)
         if response.status_code != 200:
             raise BlueBubblesError(f"Failed to download attachment: {response.status_code}")
         return response.content
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -117,6 +118,15 @@ class Attachment(BaseModel):
             return "video" in self.uti.lower() or "movie" in self.uti.lower()
         return False
 
+    @cached_property
+    def kind(self) -> str:
+        """Get the attachment kind: "image", "video" or "file"."""
+        if self.is_image:
+            return "image"
+        if self.is_video:
+            return "video"
+        return "file"
+
 
 class Message(BaseModel):
     """Represents an iMessage/SMS message."""
@@ -215,6 +225,15 @@ class Message(BaseModel):
         """Check if this message is a reaction/tapback."""
         return self.associated_message_type is not None and self.associated_message_type >= 2000
 
+    @property
+    def associated_target_guid(self) -> str | None:
+        """Get the GUID of the associated message, without any "p:X/" part prefix."""
+        guid = self.associated_message_guid
+        if not guid:
+            return None
+        # rpartition returns the whole string as the tail when there is no "/"
+        return guid.rpartition("/")[2]
+
     @property
     def tapback_type(self) -> TapbackType | None:
         """Get the tapback type if this is a reaction."""
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import sys
 from typing import Any
 
@@ -15,6 +14,7 @@ from gi.repository import Adw, Gio, GLib, Gtk
 
 from . import __app_id__, __version__
 from .api import BlueBubblesClient
+from .utils.async_loop import BackgroundLoop
 from .utils.config import Config
 
 
@@ -30,8 +30,8 @@ class BlueBubblesApplication(Adw.Application):
         self.client: BlueBubblesClient | None = None
         self._main_window: Gtk.ApplicationWindow | None = None
 
-        # Set up async event loop integration
-        self._loop = asyncio.new_event_loop()
+        # Shared background event loop for all async API work
+        self.async_loop = BackgroundLoop()
 
     def do_activate(self) -> None:
         """Called when the application is activated."""
@@ -276,9 +276,7 @@ class BlueBubblesApplication(Adw.Application):
                     from .api.client import test_connection
                     return await test_connection(server_url, password)
 
-                loop = asyncio.new_event_loop()
-                success, message = loop.run_until_complete(_test())
-                loop.close()
+                success, message = self.async_loop.run(_test())
 
                 def update_ui() -> bool:
                     connect_button.set_sensitive(True)
@@ -518,15 +516,28 @@ class BlueBubblesApplication(Adw.Application):
             )
         return self.client
 
-    def run_async(self, coro: Any) -> None:
-        """Run an async coroutine from the GTK main loop."""
-        def run_in_thread() -> None:
-            loop = asyncio.new_event_loop()
+    async def get_connected_client(self) -> BlueBubblesClient | None:
+        """Get the shared API client, connecting it on first use.
+
+        Must be awaited on the background loop: the client's connection pool
+        is bound to it and reused by every request instead of reconnecting.
+        """
+        client = self.get_client()
+        if client is not None:
+            await client.connect()  # No-op once connected
+        return client
+
+    def do_shutdown(self) -> None:
+        """Called when the application shuts down."""
+        if self._main_window and hasattr(self._main_window, 'flush_pending_saves'):
+            self._main_window.flush_pending_saves()  # type: ignore
+        if self.client is not None:
             try:
-                loop.run_until_complete(coro)
-            finally:
-                loop.close()
+                self.async_loop.run(self.client.close(), timeout=2.0)
+            except Exception as e:
+                print(f"Error closing API client: {e}")
+        Adw.Application.do_shutdown(self)
 
-        import threading
-        thread = threading.Thread(target=run_in_thread, daemon=True)
-        thread.start()
+    def run_async(self, coro: Any) -> None:
+        """Run an async coroutine from the GTK main loop."""
+        self.async_loop.submit(coro)
@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import os
 import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any
 
 import gi
@@ -11,7 +16,7 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Adw, Gdk, GdkPixbuf, Gio, GLib, Gtk
+from gi.repository import Adw, Gdk, GdkPixbuf, Gio, GLib, GObject, Gtk
 
 if TYPE_CHECKING:
     from ..application import BlueBubblesApplication
@@ -19,8 +24,39 @@ if TYPE_CHECKING:
 from ..api import BlueBubblesClient, Chat, Message, Attachment, BlueBubblesSocket
 from ..api.models import TapbackType
 from ..state import Cache
-from ..utils.debounce import Debouncer
+from ..utils.contacts import (
+    ContactSearchIndex,
+    build_contact_index,
+    build_contact_map,
+    canonical_address,
+    lookup_contact_name,
+)
+from ..utils.debounce import CallDebouncer, Debouncer
+from ..utils.lru import LRUCache
+from ..utils.phone import looks_like_phone, normalize_phone
+from ..utils.timefmt import format_message_time
 from ..utils.links import find_urls, fetch_link_preview, LinkPreview
+from .widgets.containers import remove_all_children
+
+# Print contact mapping diagnostics after each contacts sync
+_DEBUG_CONTACTS = bool(os.environ.get("BB_DEBUG_CONTACTS"))
+
+# Most message bubbles built when (re)rendering a conversation; older
+# messages stay in memory but get no widgets
+_MAX_RENDERED_MESSAGES = 200
+
+# Notification text for attachment-only messages, by Attachment.kind
+_ATTACHMENT_NOTIFICATION_BODIES = {"image": "Sent an image", "video": "Sent a video"}
+
+
+class _ContactResult(GObject.Object):
+    """A new conversation search result, as an item of the results store."""
+
+    def __init__(self, address: str, name: str, subtitle: str) -> None:
+        super().__init__()
+        self.address = address
+        self.name = name
+        self.subtitle = subtitle
 
 
 class MainWindow(Adw.ApplicationWindow):
@@ -32,15 +68,51 @@ class MainWindow(Adw.ApplicationWindow):
         self._cache = Cache()
         self._chats: list[Chat] = []
         self._chats_by_guid: dict[str, Chat] = {}
+        self._direct_chat_by_address: dict[str, str] = {}  # address variant -> 1:1 chat guid
+        self._group_chat_by_participants: dict[frozenset[str], str] = {}  # addresses -> group chat guid
         self._selected_chat: Chat | None = None
-        self._messages: list[Message] = []
+        self._messages: deque[Message] = deque()  # newest first; new messages go on the left
+        self._message_guids: set[str] = set()  # GUIDs in self._messages
+        self._messages_by_guid: dict[str, Message] = {}  # guid -> message
+        self._reactions_by_target: dict[str, list[Message]] = {}  # target guid -> reactions
+        self._bubble_by_guid: dict[str, Gtk.Widget] = {}  # message guid -> bubble container
         self._loading_chats: bool = False
         self._socket: BlueBubblesSocket | None = None
-        self._socket_thread: threading.Thread | None = None
+        self._socket_future: Future[None] | None = None
         self._contacts: dict[str, str] = {}  # address -> display name
+        self._contact_index: dict[str, str] = {}  # raw and canonical address -> name
+        self._contact_search_index: ContactSearchIndex | None = None  # built on first search
         self._message_scroll: Gtk.ScrolledWindow | None = None  # For scroll control
+        self._message_vadj: Gtk.Adjustment | None = None  # Its vertical adjustment
+        self._scroll_pin_frames = 0  # Frames left to keep following the bottom
         self._pending_conversation: dict | None = None  # For new conversations
         self._rows_by_guid: dict[str, Gtk.ListBoxRow] = {}  # chat_guid -> row widget
+        self._display_name_cache: dict[str, str] = {}  # address -> display name
+        # (guid, first three participant addresses, participant count) -> title
+        self._chat_title_cache: dict[tuple[str, tuple[str, ...], int], str] = {}
+        self._sender_color_cache: dict[str, str] = {}  # address -> bubble color
+
+        self._registered_css: dict[bytes, Gtk.CssProvider] = {}  # CSS data -> provider
+        # One provider for all generated per-color rules, so the display's
+        # provider list doesn't grow with every participant/color seen
+        self._dynamic_css_provider: Gtk.CssProvider | None = None
+        self._dynamic_css_rules: dict[str, str] = {}  # CSS class -> rule
+        self._address_class_ids: dict[str, int] = {}  # address -> participant CSS class id
+        self._rendered_header_key: tuple[Any, ...] | None = None  # what the chat header shows
+
+        # Decoded attachment images, so re-created bubbles don't re-read/decode files
+        self._texture_cache: LRUCache[str, Gdk.Texture] = LRUCache(
+            max_items=128,
+            max_cost=64 * 1024 * 1024,  # ~64 MB of RGBA pixels
+            cost_fn=lambda tex: tex.get_width() * tex.get_height() * 4,
+        )
+
+        # True while _sync_chat_rows moves rows (suppresses selection handling)
+        self._syncing_chat_rows = False
+
+        # Pending idle rebuilds, so bursts of updates only rebuild once
+        self._chat_rebuild_pending = False
+        self._message_list_update_pending = False
 
         # Debouncer for batching rapid chat list updates (e.g., multiple incoming messages)
         self._chat_update_debouncer: Debouncer[str] = Debouncer(
@@ -50,6 +122,31 @@ class MainWindow(Adw.ApplicationWindow):
             cancel_scheduler=GLib.source_remove,
         )
 
+        # Socket messages waiting to be applied in one idle callback
+        self._incoming_lock = threading.Lock()
+        self._incoming_messages: list[tuple[Message, str]] = []
+        self._incoming_flush_pending = False
+
+        # Batches cache writes of incoming socket messages. The window is
+        # fixed so a steady stream of messages can't postpone the write.
+        self._message_save_debouncer: Debouncer[tuple[str, Message]] = Debouncer(
+            callback=self._flush_message_saves,
+            delay_ms=250,
+            scheduler=lambda cb: GLib.timeout_add(250, cb),
+            cancel_scheduler=GLib.source_remove,
+            reset_on_add=False,
+        )
+        self._message_save_threads: list[threading.Thread] = []
+
+        # Collapses notification bursts into one per chat over a fixed window
+        self._notification_debouncer: Debouncer[tuple[Message, str]] = Debouncer(
+            callback=self._flush_notifications,
+            delay_ms=500,
+            scheduler=lambda cb: GLib.timeout_add(500, cb),
+            cancel_scheduler=GLib.source_remove,
+            reset_on_add=False,
+        )
+
         self._setup_window()
         self._build_ui()
         self._load_chats()
@@ -213,6 +310,9 @@ class MainWindow(Adw.ApplicationWindow):
         self._message_list.append(self._no_chat_placeholder)
 
         self._message_scroll.set_child(self._message_list)
+        # Stable for the scrolled window's lifetime, so look it up once
+        self._message_vadj = self._message_scroll.get_vadjustment()
+        self._message_vadj.connect("notify::upper", self._on_message_scroll_upper_changed)
         box.append(self._message_scroll)
 
         # Compose box
@@ -255,17 +355,22 @@ class MainWindow(Adw.ApplicationWindow):
         return box
 
     def _get_chat_title(self, chat: Chat) -> str:
-        """Get display title for a chat, using contacts if available."""
+        """Get display title for a chat, using contacts if available.
+
+        Titles built from participant names are memoized until contacts change.
+        """
         if chat.display_name:
             return chat.display_name
         if chat.participants:
-            names = []
-            for p in chat.participants[:3]:
-                name = self._get_display_name(p.address)
-                names.append(name)
-            if len(chat.participants) > 3:
-                return ", ".join(names) + f" +{len(chat.participants) - 3}"
-            return ", ".join(names)
+            shown = tuple(p.address for p in chat.participants[:3])
+            key = (chat.guid, shown, len(chat.participants))
+            title = self._chat_title_cache.get(key)
+            if title is None:
+                title = ", ".join(self._get_display_name(address) for address in shown)
+                if len(chat.participants) > 3:
+                    title += f" +{len(chat.participants) - 3}"
+                self._chat_title_cache[key] = title
+            return title
         return chat.chat_identifier
 
     def _create_chat_row(self, chat: Chat) -> Gtk.ListBoxRow:
@@ -395,6 +500,19 @@ class MainWindow(Adw.ApplicationWindow):
                 preview_text = "No messages"
             preview_label.set_label(preview_text)
 
+    def _move_chat_to_front(self, chat: Chat) -> None:
+        """Move (or replace) a chat at the front of self._chats in place."""
+        chats = self._chats
+        # Active chats are usually near the front, so this scan stops early
+        for i, c in enumerate(chats):
+            if c.guid == chat.guid:
+                if i == 0:
+                    chats[0] = chat
+                    return
+                del chats[i]
+                break
+        chats.insert(0, chat)
+
     def _move_chat_row_to_top(self, chat_guid: str) -> None:
         """Move a chat row to the top of the list."""
         row = self._rows_by_guid.get(chat_guid)
@@ -409,15 +527,20 @@ class MainWindow(Adw.ApplicationWindow):
         # Remember if this row was selected
         was_selected = self._chat_list.get_selected_row() == row
 
-        # Remove from current position
-        self._chat_list.remove(row)
+        # Don't let the transient deselect/reselect reload the conversation
+        self._syncing_chat_rows = True
+        try:
+            # Remove from current position
+            self._chat_list.remove(row)
 
-        # Insert at top
-        self._chat_list.prepend(row)
+            # Insert at top
+            self._chat_list.prepend(row)
 
-        # Restore selection if needed
-        if was_selected:
-            self._chat_list.select_row(row)
+            # Restore selection if needed
+            if was_selected:
+                self._chat_list.select_row(row)
+        finally:
+            self._syncing_chat_rows = False
 
     def _process_batched_chat_updates(self, chat_guids: list[str]) -> None:
         """Process a batch of chat updates efficiently.
@@ -455,6 +578,41 @@ class MainWindow(Adw.ApplicationWindow):
                 row = self._create_chat_row(chat)
                 self._chat_list.prepend(row)
 
+    def _flush_message_saves(self, items: list[tuple[str, Message]]) -> None:
+        """Write a batch of incoming messages to the cache on a worker thread.
+
+        This is called by the debouncer, so a burst of socket messages costs
+        one cache transaction per chat instead of one per message.
+        """
+        by_chat: dict[str, list[Message]] = {}
+        for chat_guid, message in items:
+            by_chat.setdefault(chat_guid, []).append(message)
+
+        def save() -> None:
+            for chat_guid, messages in by_chat.items():
+                try:
+                    self._cache.save_messages(chat_guid, messages)
+                except Exception as e:
+                    print(f"Error caching messages for {chat_guid}: {e}")
+
+        thread = threading.Thread(target=save, daemon=True)
+        thread.start()
+        self._message_save_threads = [
+            t for t in self._message_save_threads if t.is_alive()
+        ]
+        self._message_save_threads.append(thread)
+
+    def flush_pending_saves(self, timeout: float = 2.0) -> None:
+        """Write any batched incoming messages to the cache and wait for them.
+
+        Called on shutdown so messages received in the last debounce window
+        aren't lost with the daemon save threads.
+        """
+        self._message_save_debouncer.flush()
+        for thread in self._message_save_threads:
+            thread.join(timeout)
+        self._message_save_threads = []
+
     # Pastel color palette for sender bubbles
     # From https://www.color-hex.com/color-palette/1023412
     SENDER_COLORS = [
@@ -478,11 +636,20 @@ class MainWindow(Adw.ApplicationWindow):
         TapbackType.QUESTION: "❓",
     }
 
+    # Minimum seconds between sync progress updates, and the item count at
+    # which progress is always shown regardless of the interval
+    SYNC_STATUS_INTERVAL = 0.1
+    SYNC_STATUS_ITEM_STEP = 500
+
     def _get_sender_color(self, address: str) -> str:
         """Get a consistent color for a sender based on their address."""
-        # Hash the address to get a consistent color index
-        color_index = hash(address) % len(self.SENDER_COLORS)
-        return self.SENDER_COLORS[color_index]
+        color = self._sender_color_cache.get(address)
+        if color is None:
+            # Hash the address to get a consistent color index
+            color_index = hash(address) % len(self.SENDER_COLORS)
+            color = self.SENDER_COLORS[color_index]
+            self._sender_color_cache[address] = color
+        return color
 
     def _get_sender_name(self, message: Message) -> str:
         """Get the display name for a message sender."""
@@ -490,19 +657,80 @@ class MainWindow(Adw.ApplicationWindow):
             return self._get_display_name(message.handle.address)
         return "Unknown"
 
+    def _ensure_css(self, data: bytes) -> Gtk.CssProvider:
+        """Register a CSS provider for the display once per unique stylesheet.
+
+        Adding a provider invalidates the display's style caches, so identical
+        stylesheets requested by every bubble are only parsed and added once.
+        """
+        provider = self._registered_css.get(data)
+        if provider is None:
+            provider = Gtk.CssProvider()
+            provider.load_from_data(data)
+            Gtk.StyleContext.add_provider_for_display(
+                self.get_display(),
+                provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            self._registered_css[data] = provider
+        return provider
+
+    def _ensure_css_class(self, css_class: str, declarations: str) -> str:
+        """Define a generated CSS class once and return its name.
+
+        All generated rules live in a single display-wide provider, which is
+        only reloaded when a class is seen for the first time.
+        """
+        if css_class not in self._dynamic_css_rules:
+            self._dynamic_css_rules[css_class] = f".{css_class} {{ {declarations} }}"
+            if self._dynamic_css_provider is None:
+                self._dynamic_css_provider = Gtk.CssProvider()
+                Gtk.StyleContext.add_provider_for_display(
+                    self.get_display(),
+                    self._dynamic_css_provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+                )
+            self._dynamic_css_provider.load_from_data(
+                "\n".join(self._dynamic_css_rules.values()).encode()
+            )
+        return css_class
+
+    def _address_class_id(self, address: str) -> int:
+        """Get a stable, collision-free id for naming an address's CSS classes."""
+        class_id = self._address_class_ids.get(address)
+        if class_id is None:
+            class_id = len(self._address_class_ids)
+            self._address_class_ids[address] = class_id
+        return class_id
+
+    def _clear_sender_caches(self) -> None:
+        """Drop memoized sender colors (chat switch or contacts reload)."""
+        self._sender_color_cache.clear()
+
+    def _set_contacts(self, contacts: dict[str, str]) -> None:
+        """Replace the contact mapping and drop everything derived from it."""
+        self._contacts = contacts
+        self._contact_index = build_contact_index(contacts)
+        self._contact_search_index = None
+        self._display_name_cache.clear()
+        self._chat_title_cache.clear()
+        self._rendered_header_key = None  # Names may have changed
+
     def _get_display_name(self, address: str) -> str:
-        """Get display name for an address, using contacts if available."""
-        # Try exact match first
-        if address in self._contacts:
-            return self._contacts[address]
-        # Try all normalized phone variants
-        for variant in self._normalize_phone(address):
-            if variant in self._contacts:
-                return self._contacts[variant]
-        # Try lowercase for emails
-        if "@" in address and address.lower() in self._contacts:
-            return self._contacts[address.lower()]
-        return address
+        """Get display name for an address, using contacts if available.
+
+        Results are memoized per address (until contacts change) since the
+        same few senders are looked up for every bubble, row and notification.
+        """
+        name = self._display_name_cache.get(address)
+        if name is None:
+            name = self._lookup_display_name(address)
+            self._display_name_cache[address] = name
+        return name
+
+    def _lookup_display_name(self, address: str) -> str:
+        """Find the contact name for an address, falling back to the address."""
+        return lookup_contact_name(self._contact_index, address) or address
 
     def _get_message_status(self, message: Message) -> str:
         """Get the delivery status string for a message."""
@@ -555,8 +783,7 @@ class MainWindow(Adw.ApplicationWindow):
             badge.set_margin_start(20)
 
         # Apply badge styling
-        css = Gtk.CssProvider()
-        css.load_from_data(b"""
+        self._ensure_css(b"""
             .reaction-badge {
                 background-color: @card_bg_color;
                 border-radius: 12px;
@@ -565,11 +792,6 @@ class MainWindow(Adw.ApplicationWindow):
                 border: 1px solid alpha(@borders, 0.3);
             }
         """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
         badge.add_css_class("reaction-badge")
 
         # Add emoji for each reaction type
@@ -624,8 +846,7 @@ class MainWindow(Adw.ApplicationWindow):
         frame.set_margin_top(8)
 
         # Apply card styling
-        css = Gtk.CssProvider()
-        css.load_from_data(b"""
+        self._ensure_css(b"""
             .link-preview-card {
                 background-color: alpha(@card_bg_color, 0.8);
                 border-radius: 12px;
@@ -635,11 +856,6 @@ class MainWindow(Adw.ApplicationWindow):
                 background-color: @card_bg_color;
             }
         """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
         frame.add_css_class("link-preview-card")
 
         # Main horizontal box
@@ -714,19 +930,13 @@ class MainWindow(Adw.ApplicationWindow):
         frame.set_margin_top(8)
 
         # Apply styling
-        css = Gtk.CssProvider()
-        css.load_from_data(b"""
+        self._ensure_css(b"""
             .link-preview-placeholder {
                 background-color: alpha(@card_bg_color, 0.5);
                 border-radius: 12px;
                 padding: 8px 12px;
             }
         """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
         frame.add_css_class("link-preview-placeholder")
 
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -754,67 +964,79 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _load_link_preview_async(self, url: str, placeholder: Gtk.Widget, container: Gtk.Box) -> None:
         """Load a link preview asynchronously and replace the placeholder."""
-        def fetch_and_update() -> None:
-            async def _fetch() -> LinkPreview | None:
-                return await fetch_link_preview(url)
+        def update_widget(preview: LinkPreview | None) -> bool:
+            # Check if placeholder still exists in container
+            if placeholder.get_parent() != container:
+                return False
 
-            loop = asyncio.new_event_loop()
+            if preview and (preview.title or preview.description):
+                # Replace placeholder with preview in place, without
+                # walking the container's children to find its position
+                container.insert_child_after(self._create_link_preview_widget(preview), placeholder)
+            # Remove placeholder (also when no preview is available)
+            container.remove(placeholder)
+            return False
+
+        def on_fetched(future: Future[LinkPreview | None]) -> None:
             try:
-                preview = loop.run_until_complete(_fetch())
-                if preview and (preview.title or preview.description):
-                    def update_widget() -> bool:
-                        # Check if placeholder still exists in container
-                        if placeholder.get_parent() != container:
-                            return False
+                preview = future.result()
+            except Exception as e:
+                print(f"Error loading link preview for {url}: {e}")
+                preview = None
+            GLib.idle_add(update_widget, preview)
 
-                        # Create the actual preview widget
-                        preview_widget = self._create_link_preview_widget(preview)
-
-                        # Replace placeholder with preview
-                        # Get the position of the placeholder
-                        children = []
-                        child = container.get_first_child()
-                        pos = 0
-                        found_pos = -1
-                        while child:
-                            if child == placeholder:
-                                found_pos = pos
-                            children.append(child)
-                            child = child.get_next_sibling()
-                            pos += 1
-
-                        if found_pos >= 0:
-                            container.remove(placeholder)
-                            # Re-add at the same position
-                            if found_pos == 0:
-                                container.prepend(preview_widget)
-                            else:
-                                # Insert after the previous widget
-                                container.insert_child_after(preview_widget, children[found_pos - 1])
+        # Runs on the shared loop; no thread is needed just to wait for it
+        self.app.async_loop.submit(fetch_link_preview(url)).add_done_callback(on_fetched)
 
-                        return False
+    def _get_attachment_texture(self, path: str) -> Gdk.Texture | None:
+        """Get the decoded texture for an image file, decoding it only once.
 
-                    GLib.idle_add(update_widget)
-                else:
-                    # Remove placeholder if no preview available
-                    def remove_placeholder() -> bool:
-                        if placeholder.get_parent() == container:
-                            container.remove(placeholder)
-                        return False
-                    GLib.idle_add(remove_placeholder)
+        Safe to call from worker threads to pre-decode before touching the UI.
+        """
+        texture = self._texture_cache.get(path)
+        if texture is None:
+            try:
+                texture = Gdk.Texture.new_from_filename(path)
+            except GLib.Error:
+                return None  # Not a decodable image (e.g. video)
+            self._texture_cache.put(path, texture)
+        return texture
+
+    def _new_attachment_picture(self, path: str, is_image: bool) -> Gtk.Picture:
+        """Create a picture for an attachment, reusing a cached texture for images.
+
+        An image that hasn't been decoded yet starts as an empty picture and
+        gets its texture once the executor has decoded it.
+        """
+        if not is_image:
+            return Gtk.Picture.new_for_filename(path)
+        texture = self._texture_cache.get(path)
+        if texture is not None:
+            return Gtk.Picture.new_for_paintable(texture)
+        picture = Gtk.Picture()
+        self._load_attachment_texture(path, picture)
+        return picture
+
+    def _load_attachment_texture(self, path: str, picture: Gtk.Picture) -> None:
+        """Decode an image file off the GTK thread and show it in picture."""
+        async def _decode() -> Gdk.Texture | None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._get_attachment_texture, path)
+
+        def update_widget(texture: Gdk.Texture) -> bool:
+            picture.set_paintable(texture)
+            return False
+
+        def on_decoded(future: Future[Gdk.Texture | None]) -> None:
+            try:
+                texture = future.result()
             except Exception as e:
-                print(f"Error loading link preview for {url}: {e}")
-                # Remove placeholder on error
-                def remove_placeholder() -> bool:
-                    if placeholder.get_parent() == container:
-                        container.remove(placeholder)
-                    return False
-                GLib.idle_add(remove_placeholder)
-            finally:
-                loop.close()
+                print(f"Error decoding attachment {path}: {e}")
+                return
+            if texture is not None:
+                GLib.idle_add(update_widget, texture)
 
-        thread = threading.Thread(target=fetch_and_update, daemon=True)
-        thread.start()
+        self.app.async_loop.submit(_decode()).add_done_callback(on_decoded)
 
     def _create_attachment_widget(self, attachment: Attachment) -> Gtk.Widget | None:
         """Create a widget to display an attachment."""
@@ -852,7 +1074,7 @@ class MainWindow(Adw.ApplicationWindow):
         # Check if we have it cached
         if self._cache.has_attachment(attachment.guid):
             path = self._cache.get_attachment_path(attachment.guid)
-            picture = Gtk.Picture.new_for_filename(str(path))
+            picture = self._new_attachment_picture(str(path), attachment.is_image)
             picture.set_can_shrink(True)
             picture.set_content_fit(Gtk.ContentFit.CONTAIN)
 
@@ -918,19 +1140,13 @@ class MainWindow(Adw.ApplicationWindow):
             placeholder.set_halign(Gtk.Align.CENTER)
 
             # Apply placeholder styling
-            css = Gtk.CssProvider()
-            css.load_from_data(b"""
+            self._ensure_css(b"""
                 .attachment-placeholder {
                     background-color: rgba(128, 128, 128, 0.2);
                     border-radius: 12px;
                     padding: 16px;
                 }
             """)
-            Gtk.StyleContext.add_provider_for_display(
-                self.get_display(),
-                css,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
             placeholder.add_css_class("attachment-placeholder")
 
             spinner = Gtk.Spinner()
@@ -963,26 +1179,24 @@ class MainWindow(Adw.ApplicationWindow):
                 if not self.app.config.is_configured:
                     return None
 
-                client = BlueBubblesClient(
-                    self.app.config.server_url,  # type: ignore
-                    self.app.config.password,  # type: ignore
-                    timeout=60.0,  # Longer timeout for large attachments
-                )
+                client = await self.app.get_connected_client()
+                if client is None:
+                    return None
                 try:
-                    await client.connect()
-                    return await client.get_attachment(attachment.guid)
+                    # Longer timeout for large attachments
+                    return await client.get_attachment(attachment.guid, timeout=60.0)
                 except Exception as e:
                     print(f"Error fetching attachment {attachment.guid}: {e}")
                     return None
-                finally:
-                    await client.close()
 
-            loop = asyncio.new_event_loop()
             try:
-                data = loop.run_until_complete(_fetch())
+                data = self.app.async_loop.run(_fetch())
                 if data:
                     # Save to cache
                     path = self._cache.save_attachment(attachment.guid, data)
+                    # Decode here so the main thread only wraps the texture
+                    if attachment.is_image:
+                        self._get_attachment_texture(str(path))
 
                     # Update UI
                     def update_widget() -> bool:
@@ -994,7 +1208,7 @@ class MainWindow(Adw.ApplicationWindow):
                         widget.remove(widget.placeholder)  # type: ignore
 
                         # Add the image
-                        picture = Gtk.Picture.new_for_filename(str(path))
+                        picture = self._new_attachment_picture(str(path), attachment.is_image)
                         picture.set_can_shrink(True)
                         picture.set_content_fit(Gtk.ContentFit.CONTAIN)
 
@@ -1035,8 +1249,6 @@ class MainWindow(Adw.ApplicationWindow):
                     GLib.idle_add(update_widget)
             except Exception as e:
                 print(f"Error loading attachment: {e}")
-            finally:
-                loop.close()
 
         thread = threading.Thread(target=fetch_and_update, daemon=True)
         thread.start()
@@ -1065,8 +1277,7 @@ class MainWindow(Adw.ApplicationWindow):
             outer_box.set_halign(Gtk.Align.END)
 
             # Apply iMessage blue style via CSS
-            css_provider = Gtk.CssProvider()
-            css_provider.load_from_data(b"""
+            self._ensure_css(b"""
                 .message-bubble-sent {
                     background-color: #007AFF;
                     color: white;
@@ -1080,11 +1291,6 @@ class MainWindow(Adw.ApplicationWindow):
                     color: rgba(255, 255, 255, 0.7);
                 }
             """)
-            Gtk.StyleContext.add_provider_for_display(
-                self.get_display(),
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
             bubble.add_css_class("message-bubble-sent")
         else:
             # Received message - colored based on sender
@@ -1103,37 +1309,18 @@ class MainWindow(Adw.ApplicationWindow):
                 sender_label.add_css_class("caption")
                 sender_label.set_margin_bottom(2)
                 # Apply sender color to name
-                name_css = Gtk.CssProvider()
-                name_css.load_from_data(f"""
-                    .sender-name {{
-                        color: darker({sender_color});
-                        font-weight: 600;
-                    }}
-                """.encode())
-                Gtk.StyleContext.add_provider_for_display(
-                    self.get_display(),
-                    name_css,
-                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
-                sender_label.add_css_class("sender-name")
+                sender_label.add_css_class(self._ensure_css_class(
+                    f"sender-name-{sender_color.lstrip('#')}",
+                    f"color: darker({sender_color}); font-weight: 600;",
+                ))
                 bubble.append(sender_label)
 
             # Apply colored bubble style
-            bubble_css = Gtk.CssProvider()
-            bubble_css.load_from_data(f"""
-                .message-bubble-received {{
-                    background-color: {sender_color};
-                    color: #333333;
-                    border-radius: 18px;
-                    padding: 10px 14px;
-                }}
-            """.encode())
-            Gtk.StyleContext.add_provider_for_display(
-                self.get_display(),
-                bubble_css,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
-            bubble.add_css_class("message-bubble-received")
+            bubble.add_css_class(self._ensure_css_class(
+                f"message-bubble-received-{sender_color.lstrip('#')}",
+                f"background-color: {sender_color}; color: #333333; "
+                "border-radius: 18px; padding: 10px 14px;",
+            ))
 
         # Message text with clickable links
         link_preview_urls: list[str] = []
@@ -1186,7 +1373,7 @@ class MainWindow(Adw.ApplicationWindow):
         status_box.set_size_request(-1, 24)  # Ensure minimum height to avoid GTK warning
 
         # Timestamp
-        time_str = message.date_created_dt.strftime("%I:%M %p")
+        time_str = format_message_time(message.date_created)
         time_label = Gtk.Label(label=time_str)
         time_label.add_css_class("caption")
 
@@ -1208,8 +1395,7 @@ class MainWindow(Adw.ApplicationWindow):
             status_box.set_halign(Gtk.Align.START)
             # Show sender name in status for non-group chats too
             if not is_group:
-                sender_name = self._get_sender_name(message)
-                sender_status = Gtk.Label(label=sender_name)
+                sender_status = Gtk.Label(label=sender_address)
                 sender_status.add_css_class("caption")
                 sender_status.add_css_class("dim-label")
                 status_box.append(sender_status)
@@ -1397,35 +1583,23 @@ class MainWindow(Adw.ApplicationWindow):
         # API expects lowercase string like "love", "like", etc.
         reaction_name = reaction_type.name.lower()
 
-        def send_reaction() -> None:
-            async def _send() -> Message | None:
-                client = self.app.get_client()
-                if client is None:
-                    return None
-                async with client:
-                    return await client.send_reaction(
-                        chat_guid, message_guid, reaction_name
-                    )
+        async def _send() -> Message | None:
+            client = await self.app.get_connected_client()
+            if client is None:
+                return None
+            return await client.send_reaction(
+                chat_guid, message_guid, reaction_name
+            )
 
-            loop = asyncio.new_event_loop()
+        def on_sent(future: Future[Message | None]) -> None:
             try:
-                result = loop.run_until_complete(_send())
-                if result:
+                if future.result():
                     print(f"Sent reaction {reaction_name} to message")
             except Exception as exc:
-                error_msg = str(exc)
-                print(f"Error sending reaction: {error_msg}")
-
-                def show_error(msg: str = error_msg) -> bool:
-                    print(f"Reaction error: {msg}")
-                    return False
-
-                GLib.idle_add(show_error)
-            finally:
-                loop.close()
+                print(f"Error sending reaction: {exc}")
 
-        thread = threading.Thread(target=send_reaction, daemon=True)
-        thread.start()
+        # Runs on the shared loop; no thread is needed just to wait for it
+        self.app.async_loop.submit(_send()).add_done_callback(on_sent)
 
     def _start_inline_edit(
         self, container: Gtk.Box, bubble: Gtk.Box, message: Message
@@ -1435,31 +1609,26 @@ class MainWindow(Adw.ApplicationWindow):
             return
 
         # Find the text label in the bubble and replace it with an entry
-        # The text label should be one of the first children
+        # The text label should be one of the first children. Single pass,
+        # fetching each label's text once; the first non-empty label is kept
+        # as a fallback for labels whose text doesn't match exactly.
+        target = message.text
         text_label: Gtk.Label | None = None
-        text_label_position = -1
+        fallback_label: Gtk.Label | None = None
 
         child = bubble.get_first_child()
-        position = 0
-        children = []
         while child:
-            children.append(child)
-            if isinstance(child, Gtk.Label) and child.get_text() == message.text:
-                text_label = child
-                text_label_position = position
+            if isinstance(child, Gtk.Label):
+                label_text = child.get_text()
+                if label_text == target:
+                    text_label = child
+                    break
+                if fallback_label is None and label_text.strip():
+                    fallback_label = child
             child = child.get_next_sibling()
-            position += 1
 
         if text_label is None:
-            # Try to find label with markup (links)
-            for i, c in enumerate(children):
-                if isinstance(c, Gtk.Label):
-                    # Check if label has selectable text matching our message
-                    label_text = c.get_text()
-                    if label_text and message.text and label_text.strip():
-                        text_label = c
-                        text_label_position = i
-                        break
+            text_label = fallback_label
 
         if text_label is None:
             print("Could not find text label to edit")
@@ -1474,8 +1643,7 @@ class MainWindow(Adw.ApplicationWindow):
         edit_entry.add_css_class("edit-entry")
 
         # Apply styling
-        css = Gtk.CssProvider()
-        css.load_from_data(b"""
+        self._ensure_css(b"""
             .edit-entry {
                 background-color: rgba(255, 255, 255, 0.9);
                 color: #333;
@@ -1483,11 +1651,6 @@ class MainWindow(Adw.ApplicationWindow):
                 padding: 4px 8px;
             }
         """)
-        Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
 
         # Insert entry after the label
         bubble.insert_child_after(edit_entry, text_label)
@@ -1524,15 +1687,13 @@ class MainWindow(Adw.ApplicationWindow):
 
             def do_edit() -> None:
                 async def _edit() -> Message | None:
-                    client = self.app.get_client()
+                    client = await self.app.get_connected_client()
                     if client is None:
                         return None
-                    async with client:
-                        return await client.edit_message(message.guid, new_text)
+                    return await client.edit_message(message.guid, new_text)
 
-                loop = asyncio.new_event_loop()
                 try:
-                    result = loop.run_until_complete(_edit())
+                    result = self.app.async_loop.run(_edit())
 
                     def update_ui() -> bool:
                         if result:
@@ -1542,9 +1703,8 @@ class MainWindow(Adw.ApplicationWindow):
                             for i, m in enumerate(self._messages):
                                 if m.guid == message.guid:
                                     # Create updated message
-                                    msg_data = m.model_dump(by_alias=True)
-                                    msg_data["text"] = new_text
-                                    self._messages[i] = Message(**msg_data)
+                                    self._messages[i] = m.model_copy(update={"text": new_text})
+                                    self._messages_by_guid[m.guid] = self._messages[i]
                                     break
                             cancel_edit()
                         else:
@@ -1562,8 +1722,6 @@ class MainWindow(Adw.ApplicationWindow):
                         return False
 
                     GLib.idle_add(show_error)
-                finally:
-                    loop.close()
 
             thread = threading.Thread(target=do_edit, daemon=True)
             thread.start()
@@ -1594,6 +1752,8 @@ class MainWindow(Adw.ApplicationWindow):
         """Load chats from cache first, then sync with server."""
         self._chats = []
         self._chats_by_guid = {}
+        self._direct_chat_by_address = {}
+        self._group_chat_by_participants = {}
         self._loading_chats = True
 
         def show_status(message: str, spinning: bool = True) -> bool:
@@ -1607,7 +1767,16 @@ class MainWindow(Adw.ApplicationWindow):
             self._status_spinner.set_spinning(False)
             return False
 
+        # Chats first seen during the server sync (counted on the GTK thread)
+        synced_new_count = 0
+
+        def show_sync_progress(total_synced: int) -> bool:
+            return show_status(
+                f"Syncing... ({total_synced} fetched, {len(self._chats)} total)"
+            )
+
         def add_chats_to_ui(new_chats: list[Chat], from_cache: bool = False) -> bool:
+            nonlocal synced_new_count
             for chat in new_chats:
                 if chat.guid in self._chats_by_guid:
                     # Update existing chat - find and update the row
@@ -1619,8 +1788,11 @@ class MainWindow(Adw.ApplicationWindow):
                             break
                 else:
                     # New chat
+                    if not from_cache:
+                        synced_new_count += 1
                     self._chats.append(chat)
                     self._chats_by_guid[chat.guid] = chat
+                    self._index_chat_participants(chat)
                     row = self._create_chat_row(chat)
                     self._chat_list.append(row)
             return False
@@ -1649,17 +1821,31 @@ class MainWindow(Adw.ApplicationWindow):
                 batch_size = 50
                 offset = 0
                 total_synced = 0
-                new_chats_batch: list[Chat] = []
+                last_status_ts = 0.0
+                loop = asyncio.get_running_loop()
 
                 try:
                     await client.connect()
 
                     while True:
-                        cached_count = len(self._chats)
-                        GLib.idle_add(
-                            show_status,
-                            f"Syncing... ({total_synced} fetched, {cached_count} total)"
+                        # Throttle progress updates - on fast servers batches
+                        # arrive faster than the label can be read
+                        now = time.monotonic()
+                        crossed_boundary = (
+                            total_synced % self.SYNC_STATUS_ITEM_STEP < batch_size
                         )
+                        if (
+                            now - last_status_ts >= self.SYNC_STATUS_INTERVAL
+                            or crossed_boundary
+                        ):
+                            last_status_ts = now
+                            # Background sync updates run at low priority so they
+                            # never starve input handling and redraws
+                            GLib.idle_add(
+                                show_sync_progress,
+                                total_synced,
+                                priority=GLib.PRIORITY_LOW,
+                            )
 
                         try:
                             batch = await client.get_chats(
@@ -1677,16 +1863,15 @@ class MainWindow(Adw.ApplicationWindow):
 
                         total_synced += len(batch)
 
-                        # Save to cache
-                        self._cache.save_chats(batch)
-
-                        # Track truly new chats for the status message
-                        new_chats = [c for c in batch if c.guid not in self._chats_by_guid]
-                        new_chats_batch.extend(new_chats)
+                        # Save to cache off the loop, so sqlite doesn't stall the
+                        # socket and other requests sharing it
+                        await loop.run_in_executor(None, self._cache.save_chats, batch)
 
                         # Update UI with ALL chats from batch (both new and existing)
                         # This ensures existing chats get their data refreshed from server
-                        GLib.idle_add(add_chats_to_ui, batch, False)
+                        GLib.idle_add(
+                            add_chats_to_ui, batch, False, priority=GLib.PRIORITY_LOW
+                        )
 
                         if len(batch) < batch_size:
                             break
@@ -1695,41 +1880,35 @@ class MainWindow(Adw.ApplicationWindow):
                 finally:
                     await client.close()
 
-                final_count = len(self._chats_by_guid)
-                new_count = len(new_chats_batch)
-
-                # Sort chats by last message date and rebuild UI
+                # Sort chats by last message date and rebuild UI. Queued at the
+                # same priority after every batch, so the counts are final here.
                 def sort_and_rebuild() -> bool:
                     self._chats.sort(
                         key=lambda c: c.last_message.date_created if c.last_message else 0,
                         reverse=True
                     )
-                    self._rebuild_chat_list_preserving_selection()
-                    return False
-                GLib.idle_add(sort_and_rebuild)
+                    self._request_chat_rebuild()
 
-                if new_count > 0:
-                    GLib.idle_add(
-                        show_status,
-                        f"Synced! {new_count} new conversations ({final_count} total)",
-                        False
-                    )
-                else:
-                    GLib.idle_add(
-                        show_status,
-                        f"Up to date ({final_count} conversations)",
-                        False
-                    )
-                GLib.timeout_add(2000, hide_status)
+                    final_count = len(self._chats_by_guid)
+                    if synced_new_count > 0:
+                        show_status(
+                            f"Synced! {synced_new_count} new conversations ({final_count} total)",
+                            False,
+                        )
+                    else:
+                        show_status(f"Up to date ({final_count} conversations)", False)
+                    GLib.timeout_add(2000, hide_status)
+                    return False
+                GLib.idle_add(sort_and_rebuild, priority=GLib.PRIORITY_LOW)
 
-            loop = asyncio.new_event_loop()
             try:
-                loop.run_until_complete(_sync())
+                self.app.async_loop.run(_sync())
             except Exception as e:
                 print(f"Error syncing chats: {e}")
-                GLib.idle_add(show_status, f"Sync error: {e}", False)
+                GLib.idle_add(
+                    show_status, f"Sync error: {e}", False, priority=GLib.PRIORITY_LOW
+                )
             finally:
-                loop.close()
                 self._loading_chats = False
 
         thread = threading.Thread(target=load_and_sync, daemon=True)
@@ -1757,49 +1936,40 @@ class MainWindow(Adw.ApplicationWindow):
                 # New chat - add it
                 self._chats.append(chat)
                 self._chats_by_guid[chat.guid] = chat
+                self._index_chat_participants(chat)
 
         # Re-sort by last message date and rebuild UI
         self._chats.sort(
             key=lambda c: c.last_message.date_created if c.last_message else 0,
             reverse=True
         )
-        self._rebuild_chat_list_preserving_selection()
+        self._request_chat_rebuild()
 
     def _connect_socket(self) -> None:
         """Connect to BlueBubbles Socket.IO for real-time updates."""
         if not self.app.config.is_configured:
             return
 
-        def run_socket() -> None:
-            async def _connect() -> None:
-                self._socket = BlueBubblesSocket(
-                    self.app.config.server_url,  # type: ignore
-                    self.app.config.password,  # type: ignore
-                )
-
-                # Register callbacks
-                self._socket.on_new_message(self._on_socket_new_message)
-                self._socket.on_message_updated(self._on_socket_message_updated)
-                self._socket.on_connected(self._on_socket_connected)
-                self._socket.on_disconnected(self._on_socket_disconnected)
+        async def _connect() -> None:
+            self._socket = BlueBubblesSocket(
+                self.app.config.server_url,  # type: ignore
+                self.app.config.password,  # type: ignore
+            )
 
-                try:
-                    await self._socket.connect()
-                    await self._socket.wait()
-                except Exception as e:
-                    print(f"Socket connection error: {e}")
+            # Register callbacks
+            self._socket.on_new_message(self._on_socket_new_message)
+            self._socket.on_message_updated(self._on_socket_message_updated)
+            self._socket.on_connected(self._on_socket_connected)
+            self._socket.on_disconnected(self._on_socket_disconnected)
 
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
-                loop.run_until_complete(_connect())
+                await self._socket.connect()
+                await self._socket.wait()
             except Exception as e:
-                print(f"Socket thread error: {e}")
-            finally:
-                loop.close()
+                print(f"Socket connection error: {e}")
 
-        self._socket_thread = threading.Thread(target=run_socket, daemon=True)
-        self._socket_thread.start()
+        # Runs for the lifetime of the connection on the shared background loop
+        self._socket_future = self.app.async_loop.submit(_connect())
 
     def _on_socket_connected(self) -> None:
         """Handle socket connection established."""
@@ -1816,177 +1986,158 @@ class MainWindow(Adw.ApplicationWindow):
         GLib.idle_add(update_ui)
 
     def _on_socket_new_message(self, message: Message, chat_guid: str) -> None:
-        """Handle new message from socket."""
-        def update_ui() -> bool:
-            # Save to cache
-            self._cache.save_messages(chat_guid, [message])
-
-            # Check if this is a reaction message
-            if message.is_reaction:
-                # Handle reaction - update the target message's reaction badge
-                self._handle_new_reaction(message, chat_guid)
-                return False
-
-            # Send notification if appropriate
-            if self._should_notify(message, chat_guid):
-                self._send_notification(message, chat_guid)
-
-            # Update chat list if this is a new message for an existing chat
-            if chat_guid in self._chats_by_guid:
-                chat = self._chats_by_guid[chat_guid]
-                # Update last message
-                chat_data = chat.model_dump(by_alias=True)
-                chat_data["lastMessage"] = message.model_dump(by_alias=True)
-                updated_chat = Chat(**chat_data)
-                self._chats_by_guid[chat_guid] = updated_chat
+        """Handle new message from socket.
 
-                # Remove from current position and add to top
-                self._chats = [c for c in self._chats if c.guid != chat_guid]
-                self._chats.insert(0, updated_chat)
-
-                # Queue the UI update (debounced to batch rapid messages)
-                self._chat_update_debouncer.add(chat_guid)
-
-            # If this chat is currently selected, add the message to the view
-            if self._selected_chat and self._selected_chat.guid == chat_guid:
-                # Check if message already exists
-                if not any(m.guid == message.guid for m in self._messages):
-                    self._messages.insert(0, message)
-                    bubble = self._create_message_bubble(message, None)
-                    self._message_list.append(bubble)
+        Messages are queued and applied together in a single idle callback,
+        so a burst (e.g. on reconnect) costs one pass on the main thread.
+        """
+        with self._incoming_lock:
+            self._incoming_messages.append((message, chat_guid))
+            if self._incoming_flush_pending:
+                return
+            self._incoming_flush_pending = True
+        GLib.idle_add(self._flush_incoming_messages)
+
+    def _flush_incoming_messages(self) -> bool:
+        """Apply all queued socket messages, then scroll once."""
+        with self._incoming_lock:
+            incoming = self._incoming_messages
+            self._incoming_messages = []
+            self._incoming_flush_pending = False
+
+        added_to_view = False
+        for message, chat_guid in incoming:
+            if self._apply_incoming_message(message, chat_guid):
+                added_to_view = True
+
+        if added_to_view:
+            # Scroll to show the new messages
+            self._scroll_to_bottom()
+        return False
+
+    def _apply_incoming_message(self, message: Message, chat_guid: str) -> bool:
+        """Apply one new socket message. Returns True if a bubble was added to the view."""
+        # Queue cache write (batched and written off the main thread)
+        self._message_save_debouncer.add((chat_guid, message))
+
+        # Check if this is a reaction message
+        if message.is_reaction:
+            # Handle reaction - update the target message's reaction badge
+            self._handle_new_reaction(message, chat_guid)
+            return False
 
-                    # Load any pending attachments
-                    if hasattr(bubble, '_pending_attachments'):
-                        for attachment, widget in bubble._pending_attachments:  # type: ignore
-                            self._load_attachment_async(attachment, widget)
+        # Send notification if appropriate
+        if self._should_notify(message, chat_guid):
+            self._notification_debouncer.add((message, chat_guid))
+
+        # Update chat list if this is a new message for an existing chat
+        if chat_guid in self._chats_by_guid:
+            chat = self._chats_by_guid[chat_guid]
+            # Update last message
+            updated_chat = chat.model_copy(update={"last_message": message})
+            self._chats_by_guid[chat_guid] = updated_chat
+
+            # Remove from current position and add to top
+            self._move_chat_to_front(updated_chat)
+
+            # Queue the UI update (debounced to batch rapid messages)
+            self._chat_update_debouncer.add(chat_guid)
+
+        # If this chat is currently selected, add the message to the view
+        if self._selected_chat and self._selected_chat.guid == chat_guid:
+            # Check if message already exists
+            if message.guid not in self._message_guids:
+                self._messages.appendleft(message)
+                self._message_guids.add(message.guid)
+                self._messages_by_guid[message.guid] = message
+                bubble = self._create_message_bubble(message, None)
+                self._message_list.append(bubble)
+                self._bubble_by_guid[message.guid] = bubble
 
-                    # Load any pending link previews
-                    if hasattr(bubble, '_pending_link_previews'):
-                        for url, placeholder in bubble._pending_link_previews:  # type: ignore
-                            self._load_link_preview_async(url, placeholder, bubble._link_preview_bubble)  # type: ignore
+                # Load any pending attachments
+                if hasattr(bubble, '_pending_attachments'):
+                    for attachment, widget in bubble._pending_attachments:  # type: ignore
+                        self._load_attachment_async(attachment, widget)
 
-                    # Scroll to show the new message
-                    self._scroll_to_bottom()
+                # Load any pending link previews
+                if hasattr(bubble, '_pending_link_previews'):
+                    for url, placeholder in bubble._pending_link_previews:  # type: ignore
+                        self._load_link_preview_async(url, placeholder, bubble._link_preview_bubble)  # type: ignore
 
-            return False
+                return True
 
-        GLib.idle_add(update_ui)
+        return False
 
     def _handle_new_reaction(self, reaction_message: Message, chat_guid: str) -> None:
         """Handle a new reaction message by updating the target message's badge."""
         if not self._selected_chat or self._selected_chat.guid != chat_guid:
             return
 
-        # Add reaction to our messages list
-        if not any(m.guid == reaction_message.guid for m in self._messages):
-            self._messages.insert(0, reaction_message)
-
         # Find the target message GUID
-        target_guid = reaction_message.associated_message_guid
+        target_guid = reaction_message.associated_target_guid
         if not target_guid:
             return
 
-        # Extract UUID from "p:X/UUID" format if present
-        if "/" in target_guid:
-            target_guid = target_guid.split("/")[-1]
-
-        # Find the target message in our list
-        target_message: Message | None = None
-        for msg in self._messages:
-            if msg.guid == target_guid:
-                target_message = msg
-                break
+        # Add reaction to our messages list and reaction index
+        if reaction_message.guid not in self._message_guids:
+            self._messages.appendleft(reaction_message)
+            self._message_guids.add(reaction_message.guid)
+            self._messages_by_guid[reaction_message.guid] = reaction_message
+            self._reactions_by_target.setdefault(target_guid, []).append(reaction_message)
 
+        # Find the target message and its current bubble
+        target_message = self._messages_by_guid.get(target_guid)
         if not target_message:
             return
 
-        # Collect all reactions for this message
-        reactions: list[Message] = []
-        for msg in self._messages:
-            if msg.is_reaction and msg.associated_message_guid:
-                msg_target = msg.associated_message_guid
-                if "/" in msg_target:
-                    msg_target = msg_target.split("/")[-1]
-                if msg_target == target_guid:
-                    reactions.append(msg)
-
-        # Find the bubble container for the target message and rebuild it
-        # We need to find the widget in _message_list that corresponds to the target message
-        child = self._message_list.get_first_child()
-        prev_sibling: Gtk.Widget | None = None
-        while child:
-            if hasattr(child, '_message') and child._message.guid == target_guid:  # type: ignore
-                # Found the bubble container - rebuild it with updated reactions
-                self._message_list.remove(child)
-
-                # Create new bubble with reactions
-                new_bubble = self._create_message_bubble(target_message, reactions)
+        old_bubble = self._bubble_by_guid.get(target_guid)
+        if old_bubble is None or old_bubble.get_parent() is not self._message_list:
+            return
 
-                # Insert at the same position (after prev_sibling, or at start if none)
-                if prev_sibling:
-                    self._message_list.insert_child_after(new_bubble, prev_sibling)
-                else:
-                    self._message_list.prepend(new_bubble)
+        # Rebuild the bubble with updated reactions at the same position
+        reactions = self._reactions_by_target.get(target_guid, [])
+        prev_sibling = old_bubble.get_prev_sibling()
+        self._message_list.remove(old_bubble)
 
-                # Load any pending attachments
-                if hasattr(new_bubble, '_pending_attachments'):
-                    for attachment, widget in new_bubble._pending_attachments:  # type: ignore
-                        self._load_attachment_async(attachment, widget)
+        new_bubble = self._create_message_bubble(target_message, reactions)
+        if prev_sibling:
+            self._message_list.insert_child_after(new_bubble, prev_sibling)
+        else:
+            self._message_list.prepend(new_bubble)
+        self._bubble_by_guid[target_guid] = new_bubble
 
-                break
-            prev_sibling = child
-            child = child.get_next_sibling()
+        # Load any pending attachments
+        if hasattr(new_bubble, '_pending_attachments'):
+            for attachment, widget in new_bubble._pending_attachments:  # type: ignore
+                self._load_attachment_async(attachment, widget)
 
     def _on_socket_message_updated(self, message: Message) -> None:
         """Handle message update from socket (delivered, read, etc)."""
         def update_ui() -> bool:
             # Update message in current view if it exists
-            if self._selected_chat:
+            if self._selected_chat and message.guid in self._message_guids:
                 for i, m in enumerate(self._messages):
                     if m.guid == message.guid:
                         self._messages[i] = message
+                        self._messages_by_guid[message.guid] = message
+                        if m.is_reaction and m.associated_target_guid:
+                            reactions = self._reactions_by_target.get(m.associated_target_guid, [])
+                            self._reactions_by_target[m.associated_target_guid] = [
+                                message if r.guid == message.guid else r for r in reactions
+                            ]
                         # Rebuild the message list to reflect the update
-                        self._update_message_list()
+                        self._request_message_list_update()
                         break
             return False
 
         GLib.idle_add(update_ui)
 
-    def _normalize_phone(self, phone: str) -> list[str]:
-        """
-        Normalize a phone number for comparison (remove formatting).
-        Returns multiple variants to handle country code differences.
-        """
-        import re
-        # Remove all non-digit characters
-        digits_only = re.sub(r"[^\d]", "", phone)
-
-        variants = []
-
-        # Add the digits-only version
-        if digits_only:
-            variants.append(digits_only)
-
-            # If it starts with country code 1 (US/Canada), also try without it
-            if digits_only.startswith("1") and len(digits_only) == 11:
-                variants.append(digits_only[1:])  # Without country code
-
-            # If it's 10 digits, also try with +1 prefix
-            if len(digits_only) == 10:
-                variants.append("1" + digits_only)  # With country code
-                variants.append("+1" + digits_only)  # With + prefix
-
-            # Also add +digits version
-            variants.append("+" + digits_only)
-
-        return variants
-
     def _load_contacts(self) -> None:
         """Load contacts from cache first, then sync from server."""
         # Step 1: Load from cache immediately
         cached_contacts = self._cache.get_all_contacts()
         if cached_contacts:
-            self._contacts = cached_contacts
+            self._set_contacts(cached_contacts)
             print(f"Loaded {len(cached_contacts)} contacts from cache")
             if self._chats:
                 self._update_chat_list()
@@ -1996,54 +2147,21 @@ class MainWindow(Adw.ApplicationWindow):
                 if not self.app.config.is_configured:
                     return
 
-                client = BlueBubblesClient(
-                    self.app.config.server_url,  # type: ignore
-                    self.app.config.password,  # type: ignore
-                    timeout=30.0,
-                )
+                client = await self.app.get_connected_client()
+                if client is None:
+                    return
                 try:
-                    await client.connect()
                     contacts = await client.get_contacts()
 
                     # Build address -> name mapping
-                    contact_map: dict[str, str] = {}
-                    for contact in contacts:
-                        name = contact.name
-                        if not name:
-                            continue
-                        # Map all phone numbers and emails to this contact's name
-                        for phone in contact.phones:
-                            addr = phone.get("address", "")
-                            if addr:
-                                # Store original and all normalized variants
-                                contact_map[addr] = name
-                                for variant in self._normalize_phone(addr):
-                                    contact_map[variant] = name
-                        for email in contact.emails:
-                            addr = email.get("address", "")
-                            if addr:
-                                contact_map[addr.lower()] = name
+                    contact_map = build_contact_map(contacts)
+
+                    if _DEBUG_CONTACTS:
+                        self._debug_contact_map(contact_map)
 
                     def update_contacts() -> bool:
-                        self._contacts = contact_map
+                        self._set_contacts(contact_map)
                         print(f"Loaded {len(contact_map)} contact mappings from {len(contacts)} contacts")
-                        # Debug: show first few mappings and check specific numbers
-                        for i, (addr, name) in enumerate(list(contact_map.items())[:5]):
-                            print(f"  Contact: {addr} -> {name}")
-                        # Check for specific numbers user asked about
-                        for test_num in ["+14157309533", "+13397880769"]:
-                            found = False
-                            if test_num in contact_map:
-                                print(f"  FOUND: {test_num} -> {contact_map[test_num]}")
-                                found = True
-                            else:
-                                for variant in self._normalize_phone(test_num):
-                                    if variant in contact_map:
-                                        print(f"  FOUND ({variant}): {test_num} -> {contact_map[variant]}")
-                                        found = True
-                                        break
-                            if not found:
-                                print(f"  NOT FOUND: {test_num}")
                         # Save to cache
                         self._cache.save_contacts(contact_map)
                         # Refresh chat list to show new names
@@ -2054,29 +2172,62 @@ class MainWindow(Adw.ApplicationWindow):
                     GLib.idle_add(update_contacts)
                 except Exception as e:
                     print(f"Error loading contacts: {e}")
-                finally:
-                    await client.close()
 
-            loop = asyncio.new_event_loop()
             try:
-                loop.run_until_complete(_fetch())
+                self.app.async_loop.run(_fetch())
             except Exception as e:
                 print(f"Contact fetch error: {e}")
-            finally:
-                loop.close()
 
         thread = threading.Thread(target=fetch_contacts, daemon=True)
         thread.start()
 
+    def _debug_contact_map(self, contact_map: dict[str, str]) -> None:
+        """Print sample contact mappings and lookups (enabled with BB_DEBUG_CONTACTS)."""
+        for addr, name in list(contact_map.items())[:5]:
+            print(f"  Contact: {addr} -> {name}")
+
+        # Comma-separated addresses to look up, e.g. BB_DEBUG_CONTACTS=+15551234567
+        probes = [a.strip() for a in os.environ.get("BB_DEBUG_CONTACTS", "").split(",")]
+        for test_num in probes:
+            if not test_num or test_num == "1":
+                continue
+            if test_num in contact_map:
+                print(f"  FOUND: {test_num} -> {contact_map[test_num]}")
+                continue
+            for variant in normalize_phone(test_num):
+                if variant in contact_map:
+                    print(f"  FOUND ({variant}): {test_num} -> {contact_map[variant]}")
+                    break
+            else:
+                print(f"  NOT FOUND: {test_num}")
+
     def _scroll_to_bottom(self) -> None:
-        """Scroll the message list to the bottom."""
-        def do_scroll() -> bool:
-            if self._message_scroll:
-                adj = self._message_scroll.get_vadjustment()
-                adj.set_value(adj.get_upper() - adj.get_page_size())
-            return False
-        # Delay slightly to let the UI render
-        GLib.timeout_add(100, do_scroll)
+        """Scroll the message list to the bottom.
+
+        Newly added bubbles are only measured during the next frame's layout,
+        so keep following the bottom as the adjustment grows until that
+        frame is done, instead of waiting a fixed delay.
+        """
+        if self._message_scroll is None or self._message_vadj is None:
+            return
+
+        adj = self._message_vadj
+        adj.set_value(adj.get_upper() - adj.get_page_size())
+
+        # The first tick runs before the pending layout, the second after it
+        if self._scroll_pin_frames == 0:
+            self._message_scroll.add_tick_callback(self._on_scroll_pin_tick)
+        self._scroll_pin_frames = 2
+
+    def _on_scroll_pin_tick(self, _widget: Gtk.Widget, _clock: Gdk.FrameClock) -> bool:
+        """Count down frames while pinned to the bottom. Returns False to remove itself."""
+        self._scroll_pin_frames -= 1
+        return self._scroll_pin_frames > 0
+
+    def _on_message_scroll_upper_changed(self, adj: Gtk.Adjustment, _pspec: Any) -> None:
+        """Follow content growth to the bottom while a scroll-to-bottom is pending."""
+        if self._scroll_pin_frames > 0:
+            adj.set_value(adj.get_upper() - adj.get_page_size())
 
     def _show_image_preview(self, image_path: str, title: str = "Image") -> None:
         """Show a fullscreen image preview dialog."""
@@ -2111,57 +2262,95 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.present(self)
 
     def _update_chat_list(self) -> None:
-        """Update the chat list UI."""
-        # Clear row tracking
-        self._rows_by_guid.clear()
+        """Update the chat list UI, refreshing every row's title and preview."""
+        self._sync_chat_rows(refresh=True)
 
-        # Clear existing rows
-        while True:
-            row = self._chat_list.get_row_at_index(0)
-            if row is None:
-                break
-            self._chat_list.remove(row)
+    def _sync_chat_rows(self, refresh: bool = False) -> None:
+        """Make the chat list rows match self._chats.
 
-        # Add chat rows
-        for chat in self._chats:
-            row = self._create_chat_row(chat)
-            self._chat_list.append(row)
+        Existing rows are reused and only moved when out of place; rows are
+        only created for new chats and removed for chats that are gone.
+        Selection handling is suppressed while rows move, and the selected
+        row is restored afterwards. A pending new-conversation row is kept
+        at the top, ahead of the chat rows.
 
-    def _rebuild_chat_list_preserving_selection(self) -> None:
-        """Rebuild the chat list UI while preserving the current selection."""
-        # Remember the currently selected chat
-        selected_guid = self._selected_chat.guid if self._selected_chat else None
+        Args:
+            refresh: Update the content of every reused row (e.g. after
+                contacts change), not just rows whose chat object changed.
+        """
+        selected_row = self._chat_list.get_selected_row()
+        self._syncing_chat_rows = True
+        try:
+            # Drop rows for chats that are no longer listed
+            wanted = {chat.guid for chat in self._chats}
+            for guid in [g for g in self._rows_by_guid if g not in wanted]:
+                row = self._rows_by_guid.pop(guid)
+                if row.get_parent() is self._chat_list:
+                    self._chat_list.remove(row)
+
+            # The pending conversation row isn't in _rows_by_guid; pin it
+            # first and lay the chat rows out after it
+            offset = 0
+            pending_row = (self._pending_conversation or {}).get("row")
+            if pending_row is not None and pending_row.get_parent() is self._chat_list:
+                if self._chat_list.get_row_at_index(0) is not pending_row:
+                    self._chat_list.remove(pending_row)
+                    self._chat_list.prepend(pending_row)
+                offset = 1
+
+            for index, chat in enumerate(self._chats, start=offset):
+                row = self._rows_by_guid.get(chat.guid)
+                if row is None:
+                    # New chat (registers itself in _rows_by_guid)
+                    self._chat_list.insert(self._create_chat_row(chat), index)
+                    continue
 
-        # Clear row tracking
-        self._rows_by_guid.clear()
+                if refresh or row.chat is not chat:  # type: ignore
+                    self._update_chat_row_content(row, chat)
 
-        # Clear existing rows
-        while True:
-            row = self._chat_list.get_row_at_index(0)
-            if row is None:
-                break
-            self._chat_list.remove(row)
+                if self._chat_list.get_row_at_index(index) is not row:
+                    if row.get_parent() is self._chat_list:
+                        self._chat_list.remove(row)
+                    self._chat_list.insert(row, index)
+
+            if selected_row is not None and selected_row.get_parent() is self._chat_list:
+                self._chat_list.select_row(selected_row)
+        finally:
+            self._syncing_chat_rows = False
 
-        # Add chat rows in new order
-        selected_row: Gtk.ListBoxRow | None = None
-        for chat in self._chats:
-            row = self._create_chat_row(chat)
-            self._chat_list.append(row)
-            # Track the row for the selected chat
-            if selected_guid and chat.guid == selected_guid:
-                selected_row = row
+    def _request_chat_rebuild(self) -> None:
+        """Schedule a chat list rebuild, coalescing repeated requests into one idle rebuild."""
+        if self._chat_rebuild_pending:
+            return
+        self._chat_rebuild_pending = True
+
+        def do_rebuild() -> bool:
+            self._chat_rebuild_pending = False
+            self._rebuild_chat_list_preserving_selection()
+            return False
 
-        # Restore selection without triggering the handler
-        if selected_row:
-            self._chat_list.select_row(selected_row)
+        GLib.idle_add(do_rebuild)
+
+    def _rebuild_chat_list_preserving_selection(self) -> None:
+        """Reorder the chat list UI to match self._chats while preserving the current selection."""
+        self._sync_chat_rows()
 
     def _on_chat_selected(self, _listbox: Gtk.ListBox, row: Gtk.ListBoxRow | None) -> None:
         """Handle chat selection."""
+        if self._syncing_chat_rows:
+            return  # Rows are only being reordered
+
         if row is None:
             self._selected_chat = None
             return
 
+        if self._selected_chat and row.chat.guid == self._selected_chat.guid:  # type: ignore
+            # Same chat reselected - nothing to rebuild or reload
+            self._split_view.set_show_content(True)
+            return
+
         self._selected_chat = row.chat  # type: ignore
+        self._clear_sender_caches()
 
         # Update header with colored participant names
         self._update_chat_header()
@@ -2178,12 +2367,19 @@ class MainWindow(Adw.ApplicationWindow):
     def _update_chat_header(self) -> None:
         """Update the chat header with colored participant names."""
         if self._selected_chat is None:
+            self._rendered_header_key = None
             self._content_title.set_title("Select a conversation")
             self._content_title.set_subtitle("")
             return
 
         chat = self._selected_chat
 
+        # Skip rebuilding the title widgets if nothing shown in them changed
+        header_key = (chat.guid, chat.display_name, tuple(p.address for p in chat.participants))
+        if header_key == self._rendered_header_key:
+            return
+        self._rendered_header_key = header_key
+
         if chat.display_name:
             # Use display name as title
             self._content_title.set_title(chat.display_name)
@@ -2207,19 +2403,10 @@ class MainWindow(Adw.ApplicationWindow):
                     name_label.add_css_class("caption")
 
                     # Apply color
-                    css = Gtk.CssProvider()
-                    css.load_from_data(f"""
-                        .participant-{abs(hash(participant.address)) % 10000} {{
-                            color: shade({color}, 0.6);
-                            font-weight: 500;
-                        }}
-                    """.encode())
-                    Gtk.StyleContext.add_provider_for_display(
-                        self.get_display(),
-                        css,
-                        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                    )
-                    name_label.add_css_class(f"participant-{abs(hash(participant.address)) % 10000}")
+                    name_label.add_css_class(self._ensure_css_class(
+                        f"participant-{self._address_class_id(participant.address)}",
+                        f"color: shade({color}, 0.6); font-weight: 500;",
+                    ))
                     subtitle_box.append(name_label)
 
                 if len(chat.participants) > 5:
@@ -2253,18 +2440,10 @@ class MainWindow(Adw.ApplicationWindow):
                 title_label = Gtk.Label(label=display_name)
                 title_label.add_css_class("title")
 
-                css = Gtk.CssProvider()
-                css.load_from_data(f"""
-                    .single-participant {{
-                        color: shade({color}, 0.6);
-                    }}
-                """.encode())
-                Gtk.StyleContext.add_provider_for_display(
-                    self.get_display(),
-                    css,
-                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
-                title_label.add_css_class("single-participant")
+                title_label.add_css_class(self._ensure_css_class(
+                    f"single-participant-{color.lstrip('#')}",
+                    f"color: shade({color}, 0.6);",
+                ))
 
                 self._content_header.set_title_widget(title_label)
             else:
@@ -2284,18 +2463,10 @@ class MainWindow(Adw.ApplicationWindow):
                     name_label = Gtk.Label(label=display_name)
                     name_label.add_css_class("title")
 
-                    css = Gtk.CssProvider()
-                    css.load_from_data(f"""
-                        .participant-title-{abs(hash(participant.address)) % 10000} {{
-                            color: shade({color}, 0.6);
-                        }}
-                    """.encode())
-                    Gtk.StyleContext.add_provider_for_display(
-                        self.get_display(),
-                        css,
-                        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                    )
-                    name_label.add_css_class(f"participant-title-{abs(hash(participant.address)) % 10000}")
+                    name_label.add_css_class(self._ensure_css_class(
+                        f"participant-title-{self._address_class_id(participant.address)}",
+                        f"color: shade({color}, 0.6);",
+                    ))
                     title_box.append(name_label)
 
                 if len(chat.participants) > 4:
@@ -2323,24 +2494,20 @@ class MainWindow(Adw.ApplicationWindow):
             if self._selected_chat and self._selected_chat.guid == chat_guid:
                 if replace:
                     # First load from cache - full replace is OK
-                    self._messages = messages
+                    self._messages = deque(messages)
                 else:
                     # Server sync - merge to preserve locally added messages
-                    existing_guids = {m.guid for m in self._messages}
                     new_guids = {m.guid for m in messages}
 
-                    # Start with new server messages
-                    merged = list(messages)
-
-                    # Add any local messages not in server response (recently sent)
-                    for msg in self._messages:
-                        if msg.guid not in new_guids:
-                            merged.append(msg)
+                    # Local messages not in server response (recently sent)
+                    local_only = [m for m in self._messages if m.guid not in new_guids]
 
-                    # Sort by date (newest first for the DESC order we use)
-                    merged.sort(key=lambda m: m.date_created, reverse=True)
-                    self._messages = merged
+                    # Both lists are already newest first, so merge instead of re-sorting
+                    self._messages = deque(heapq.merge(
+                        messages, local_only, key=lambda m: m.date_created, reverse=True
+                    ))
 
+                self._index_messages()
                 self._update_message_list()
             return False
 
@@ -2352,24 +2519,13 @@ class MainWindow(Adw.ApplicationWindow):
 
             # Step 2: Fetch from server
             async def _fetch() -> list[Message]:
-                from ..api import BlueBubblesClient
-
-                if not self.app.config.is_configured:
+                client = await self.app.get_connected_client()
+                if client is None:
                     return []
+                return await client.get_chat_messages(chat_guid, limit=50)
 
-                client = BlueBubblesClient(
-                    self.app.config.server_url,  # type: ignore
-                    self.app.config.password,  # type: ignore
-                )
-                try:
-                    await client.connect()
-                    return await client.get_chat_messages(chat_guid, limit=50)
-                finally:
-                    await client.close()
-
-            loop = asyncio.new_event_loop()
             try:
-                messages = loop.run_until_complete(_fetch())
+                messages = self.app.async_loop.run(_fetch())
                 if messages:
                     # Save to cache
                     self._cache.save_messages(chat_guid, messages)
@@ -2377,45 +2533,63 @@ class MainWindow(Adw.ApplicationWindow):
             except Exception as e:
                 print(f"Error loading messages: {e}")
                 # Keep cached messages if server fetch fails
-            finally:
-                loop.close()
 
         thread = threading.Thread(target=load_and_sync, daemon=True)
         thread.start()
 
+    def _index_messages(self) -> None:
+        """Rebuild the GUID and reaction indexes after self._messages is replaced.
+
+        Incremental inserts/updates keep the indexes current themselves, so
+        this only runs when a chat's messages are (re)loaded.
+        """
+        self._message_guids = {m.guid for m in self._messages}
+        self._messages_by_guid = {m.guid: m for m in self._messages}
+        reactions_by_target: dict[str, list[Message]] = {}
+        for message in self._messages:
+            if message.is_reaction:
+                target_guid = message.associated_target_guid
+                if target_guid:
+                    reactions_by_target.setdefault(target_guid, []).append(message)
+        self._reactions_by_target = reactions_by_target
+
+    def _request_message_list_update(self) -> None:
+        """Schedule a message list rebuild, coalescing repeated requests into one idle rebuild."""
+        if self._message_list_update_pending:
+            return
+        self._message_list_update_pending = True
+
+        def do_update() -> bool:
+            self._message_list_update_pending = False
+            self._update_message_list()
+            return False
+
+        GLib.idle_add(do_update)
+
     def _update_message_list(self) -> None:
         """Update the message list UI."""
         # Clear existing messages
-        while True:
-            child = self._message_list.get_first_child()
-            if child is None:
-                break
-            self._message_list.remove(child)
+        remove_all_children(self._message_list)
+
+        self._bubble_by_guid = {}
 
-        # Build reactions map: message GUID -> list of reaction messages
-        # Note: associated_message_guid may have format "p:X/UUID" so we need to extract the UUID
-        reactions_map: dict[str, list[Message]] = {}
+        # Only the newest messages get bubbles (reaction messages themselves are skipped)
+        visible: list[Message] = []
         for message in self._messages:
-            if message.is_reaction and message.associated_message_guid:
-                guid = message.associated_message_guid
-                # Extract UUID from "p:X/UUID" format if present
-                if "/" in guid:
-                    guid = guid.split("/")[-1]
-                if guid not in reactions_map:
-                    reactions_map[guid] = []
-                reactions_map[guid].append(message)
+            if not message.is_reaction:
+                visible.append(message)
+                if len(visible) >= _MAX_RENDERED_MESSAGES:
+                    break
 
         # Add message bubbles (in chronological order)
         pending_attachment_loads: list[tuple[Attachment, Gtk.Box]] = []
         pending_preview_loads: list[tuple[str, Gtk.Widget, Gtk.Box]] = []
-        for message in reversed(self._messages):
-            if message.is_reaction:
-                continue  # Skip reaction messages themselves
-
+        for message in reversed(visible):
             # Get reactions for this message
-            reactions = reactions_map.get(message.guid)
+            reactions = self._reactions_by_target.get(message.guid)
             bubble = self._create_message_bubble(message, reactions)
             self._message_list.append(bubble)
+            self._bubble_by_guid[message.guid] = bubble
 
             # Collect pending attachment loads
             if hasattr(bubble, '_pending_attachments'):
@@ -2444,15 +2618,8 @@ class MainWindow(Adw.ApplicationWindow):
             print(f"Chat {chat_guid} not found")
             return
 
-        # Find the row in the list box
-        row_index = 0
-        for i, chat in enumerate(self._chats):
-            if chat.guid == chat_guid:
-                row_index = i
-                break
-
         # Select the row
-        row = self._chat_list.get_row_at_index(row_index)
+        row = self._rows_by_guid.get(chat_guid)
         if row:
             self._chat_list.select_row(row)
             # Trigger the selection handler
@@ -2476,6 +2643,19 @@ class MainWindow(Adw.ApplicationWindow):
 
         return True
 
+    def _flush_notifications(self, items: list[tuple[Message, str]]) -> None:
+        """Show one notification per chat for a burst of messages (the latest one).
+
+        Notification state is checked again here, since the user may have
+        opened the chat while the batch was waiting.
+        """
+        latest: dict[str, Message] = {}
+        for message, chat_guid in items:
+            latest[chat_guid] = message
+        for chat_guid, message in latest.items():
+            if self._should_notify(message, chat_guid):
+                self._send_notification(message, chat_guid)
+
     def _send_notification(self, message: Message, chat_guid: str) -> None:
         """Send a desktop notification for a new message."""
         # Get sender name
@@ -2491,12 +2671,9 @@ class MainWindow(Adw.ApplicationWindow):
         if not body and message.attachments:
             # Describe attachment
             attachment = message.attachments[0]
-            if attachment.is_image:
-                body = "Sent an image"
-            elif attachment.is_video:
-                body = "Sent a video"
-            else:
-                body = f"Sent a file: {attachment.transfer_name or 'attachment'}"
+            body = _ATTACHMENT_NOTIFICATION_BODIES.get(attachment.kind) or (
+                f"Sent a file: {attachment.transfer_name or 'attachment'}"
+            )
 
         # Truncate long messages
         if len(body) > 100:
@@ -2569,6 +2746,44 @@ class MainWindow(Adw.ApplicationWindow):
         results_scroll.set_child(results_list)
         content_box.append(results_scroll)
 
+        def create_result_row(result: _ContactResult) -> Gtk.ListBoxRow:
+            """Build the row for one search result."""
+            row = Gtk.ListBoxRow()
+            row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+            row_box.set_margin_start(12)
+            row_box.set_margin_end(12)
+            row_box.set_margin_top(8)
+            row_box.set_margin_bottom(8)
+
+            # Avatar
+            avatar = Adw.Avatar(size=32, text=result.name, show_initials=True)
+            row_box.append(avatar)
+
+            # Text
+            text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+            name_label = Gtk.Label(label=result.name, xalign=0)
+            name_label.add_css_class("heading")
+            text_box.append(name_label)
+
+            if result.subtitle != result.name:
+                subtitle_label = Gtk.Label(label=result.subtitle, xalign=0)
+                subtitle_label.add_css_class("caption")
+                subtitle_label.add_css_class("dim-label")
+                text_box.append(subtitle_label)
+
+            row_box.append(text_box)
+            row.set_child(row_box)
+
+            # Store data on row
+            row._contact_address = result.address  # type: ignore
+            row._contact_name = result.name  # type: ignore
+            return row
+
+        # Results live in a store bound to the list, so a new search replaces
+        # them with one splice instead of removing and appending each row
+        results_store = Gio.ListStore.new(_ContactResult)
+        results_list.bind_model(results_store, create_result_row)
+
         # Start conversation button
         start_button = Gtk.Button(label="Start Conversation")
         start_button.add_css_class("suggested-action")
@@ -2583,6 +2798,16 @@ class MainWindow(Adw.ApplicationWindow):
             """Update start button sensitivity."""
             start_button.set_sensitive(len(selected_recipients) > 0)
 
+        # Recipient chip styling, registered once rather than per chip
+        self._ensure_css(b"""
+            .recipient-chip {
+                padding: 4px 8px;
+                border-radius: 16px;
+                background-color: @accent_bg_color;
+                color: @accent_fg_color;
+            }
+        """)
+
         def add_recipient(address: str, display_name: str) -> None:
             """Add a recipient chip."""
             # Check if already added
@@ -2600,20 +2825,6 @@ class MainWindow(Adw.ApplicationWindow):
             chip.set_margin_bottom(2)
 
             # Apply chip styling
-            css = Gtk.CssProvider()
-            css.load_from_data(b"""
-                .recipient-chip {
-                    padding: 4px 8px;
-                    border-radius: 16px;
-                    background-color: @accent_bg_color;
-                    color: @accent_fg_color;
-                }
-            """)
-            Gtk.StyleContext.add_provider_for_display(
-                self.get_display(),
-                css,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
             chip.add_css_class("recipient-chip")
 
             label = Gtk.Label(label=display_name)
@@ -2646,91 +2857,51 @@ class MainWindow(Adw.ApplicationWindow):
 
             # Clear search
             search_entry.set_text("")
+            search_debouncer.cancel()
             update_results("")
             update_start_button()
 
         def update_results(query: str) -> None:
             """Update the results list based on search query."""
-            # Clear existing results
-            while True:
-                row = results_list.get_row_at_index(0)
-                if row is None:
-                    break
-                results_list.remove(row)
-
             if not query:
+                results_store.remove_all()
                 return
 
-            query_lower = query.lower()
             matches: list[tuple[str, str, str]] = []  # (address, display_name, subtitle)
 
-            # Search through contacts
-            seen_addresses: set[str] = set()
-            for address, name in self._contacts.items():
-                if address in seen_addresses:
-                    continue
-                # Skip variants (only show one per contact)
-                if any(addr == address for addr, _ in selected_recipients):
-                    continue
-
-                # Match against name or address
-                if query_lower in name.lower() or query_lower in address.lower():
-                    # Determine if this is a phone or email
-                    if "@" in address:
-                        subtitle = address
-                    else:
-                        # Format phone number for display
-                        subtitle = address
-                    matches.append((address, name, subtitle))
-                    seen_addresses.add(address)
-
-                    # Also mark normalized variants as seen
-                    for variant in self._normalize_phone(address):
-                        seen_addresses.add(variant)
+            # Search through contacts (one entry per phone number/email)
+            selected_addresses = [addr for addr, _ in selected_recipients]
+            contact_index = self._get_contact_search_index()
+            for address, name in contact_index.search(query, selected_addresses, limit=10):
+                matches.append((address, name, address))
 
             # If query looks like a phone number or email, add option to use it directly
-            is_phone = query.replace("+", "").replace("-", "").replace(" ", "").replace("(", "").replace(")", "").isdigit()
+            is_phone = looks_like_phone(query)
             is_email = "@" in query and "." in query
 
-            if (is_phone or is_email) and query not in seen_addresses:
-                matches.insert(0, (query, query, "Send to this address"))
-
-            # Limit results
-            for address, name, subtitle in matches[:10]:
-                row = Gtk.ListBoxRow()
-                row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-                row_box.set_margin_start(12)
-                row_box.set_margin_end(12)
-                row_box.set_margin_top(8)
-                row_box.set_margin_bottom(8)
-
-                # Avatar
-                avatar = Adw.Avatar(size=32, text=name, show_initials=True)
-                row_box.append(avatar)
-
-                # Text
-                text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-                name_label = Gtk.Label(label=name, xalign=0)
-                name_label.add_css_class("heading")
-                text_box.append(name_label)
-
-                if subtitle != name:
-                    subtitle_label = Gtk.Label(label=subtitle, xalign=0)
-                    subtitle_label.add_css_class("caption")
-                    subtitle_label.add_css_class("dim-label")
-                    text_box.append(subtitle_label)
-
-                row_box.append(text_box)
-                row.set_child(row_box)
-
-                # Store data on row
-                row._contact_address = address  # type: ignore
-                row._contact_name = name  # type: ignore
-
-                results_list.append(row)
+            if is_phone or is_email:
+                # Offer the raw address unless a shown contact already covers it
+                shown = {canonical_address(address) for address, _, _ in matches}
+                if canonical_address(query) not in shown:
+                    matches.insert(0, (query, query, "Send to this address"))
+
+            # Limit results; the list builds the rows for the new items
+            results = [
+                _ContactResult(address, name, subtitle)
+                for address, name, subtitle in matches[:10]
+            ]
+            results_store.splice(0, results_store.get_n_items(), results)
+
+        # Coalesce keystrokes into a single search once typing pauses
+        search_debouncer = CallDebouncer(
+            callback=lambda: update_results(search_entry.get_text()),
+            delay_ms=200,
+            scheduler=lambda cb: GLib.timeout_add(200, cb),
+            cancel_scheduler=GLib.source_remove,
+        )
 
-        def on_search_changed(entry: Gtk.SearchEntry) -> None:
-            update_results(entry.get_text())
+        def on_search_changed(_entry: Gtk.SearchEntry) -> None:
+            search_debouncer.call()
 
         def on_result_selected(listbox: Gtk.ListBox, row: Gtk.ListBoxRow | None) -> None:
             if row is None:
@@ -2760,8 +2931,10 @@ class MainWindow(Adw.ApplicationWindow):
                 dialog.close()
                 self._create_pending_conversation(addresses, names)
 
-        # Connect signals
-        search_entry.connect("search-changed", on_search_changed)
+        # Connect signals ("changed" rather than "search-changed", which has
+        # its own built-in delay, so only our debouncer sets the pace)
+        search_entry.connect("changed", on_search_changed)
+        dialog.connect("closed", lambda _dialog: search_debouncer.cancel())
         results_list.connect("row-selected", on_result_selected)
         start_button.connect("clicked", on_start_clicked)
 
@@ -2771,6 +2944,9 @@ class MainWindow(Adw.ApplicationWindow):
             if not query:
                 return
 
+            # Run any pending search now so the results match what was typed
+            search_debouncer.flush()
+
             # Check if there's a selected row
             row = results_list.get_selected_row()
             if row:
@@ -2784,7 +2960,7 @@ class MainWindow(Adw.ApplicationWindow):
                 return
 
             # If query looks like a phone/email, add it directly
-            is_phone = query.replace("+", "").replace("-", "").replace(" ", "").replace("(", "").replace(")", "").isdigit()
+            is_phone = looks_like_phone(query)
             is_email = "@" in query and "." in query
             if is_phone or is_email:
                 add_recipient(query, query)
@@ -2794,39 +2970,41 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.present(self)
         search_entry.grab_focus()
 
+    def _get_contact_search_index(self) -> ContactSearchIndex:
+        """Get the contact search index, rebuilding it if contacts changed."""
+        if self._contact_search_index is None:
+            self._contact_search_index = ContactSearchIndex(self._contacts)
+        return self._contact_search_index
+
+    def _index_chat_participants(self, chat: Chat) -> None:
+        """Record a chat's participants for _find_existing_chat lookups."""
+        if not chat.participants:
+            return
+
+        if chat.is_group:
+            key = frozenset(p.address for p in chat.participants)
+            self._group_chat_by_participants.setdefault(key, chat.guid)
+        elif len(chat.participants) == 1:
+            # Index every phone format variant so lookups need no normalizing scan
+            address = chat.participants[0].address
+            self._direct_chat_by_address.setdefault(address, chat.guid)
+            for variant in normalize_phone(address):
+                self._direct_chat_by_address.setdefault(variant, chat.guid)
+
     def _find_existing_chat(self, addresses: list[str]) -> str | None:
         """Find an existing chat with the given participants."""
         if len(addresses) == 1:
             # Single recipient - look for 1:1 chat
             target = addresses[0]
-            target_variants = set(self._normalize_phone(target))
-            target_variants.add(target)
-
-            for chat in self._chats:
-                if chat.is_group:
-                    continue
-                if not chat.participants or len(chat.participants) != 1:
-                    continue
-
-                participant_addr = chat.participants[0].address
-                participant_variants = set(self._normalize_phone(participant_addr))
-                participant_variants.add(participant_addr)
-
-                # Check if any variants match
-                if target_variants & participant_variants:
-                    return chat.guid
+            for variant in (target, *normalize_phone(target)):
+                chat_guid = self._direct_chat_by_address.get(variant)
+                if chat_guid in self._chats_by_guid:
+                    return chat_guid
         else:
             # Group chat - look for matching participants
-            target_set = set(addresses)
-            for chat in self._chats:
-                if not chat.is_group:
-                    continue
-                if not chat.participants:
-                    continue
-
-                chat_addresses = {p.address for p in chat.participants}
-                if chat_addresses == target_set:
-                    return chat.guid
+            chat_guid = self._group_chat_by_participants.get(frozenset(addresses))
+            if chat_guid in self._chats_by_guid:
+                return chat_guid
 
         return None
 
@@ -2889,22 +3067,24 @@ class MainWindow(Adw.ApplicationWindow):
         # Insert at top of chat list
         self._chat_list.prepend(row)
         self._chat_list.select_row(row)
+        self._pending_conversation["row"] = row
 
         # Set up the content area for this pending conversation
         self._selected_chat = None
-        self._messages = []
+        self._messages = deque()
+        self._message_guids = set()
+        self._messages_by_guid = {}
+        self._reactions_by_target = {}
+        self._bubble_by_guid = {}
 
         # Update header
+        self._rendered_header_key = None
         self._content_title.set_title(display_name)
         self._content_title.set_subtitle("New conversation")
         self._content_header.set_title_widget(self._content_title)
 
         # Clear message list
-        while True:
-            child = self._message_list.get_first_child()
-            if child is None:
-                break
-            self._message_list.remove(child)
+        remove_all_children(self._message_list)
 
         # Show empty state for new conversation
         empty_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
@@ -2949,63 +3129,59 @@ class MainWindow(Adw.ApplicationWindow):
         # Add an optimistic local message immediately for responsiveness
         # This will be updated when the server confirms
 
-        def send_message() -> None:
-            async def _send() -> Message | None:
-                client = self.app.get_client()
-                if client is None:
-                    return None
-                try:
-                    await client.connect()
-                    return await client.send_message(chat_guid, text)
-                finally:
-                    await client.close()
+        async def _send() -> Message | None:
+            client = await self.app.get_connected_client()
+            if client is None:
+                return None
+            return await client.send_message(chat_guid, text)
+
+        def update_ui(message: Message | None) -> bool:
+            if message:
+                # Save to cache (batched on a worker thread, off the UI thread)
+                self._message_save_debouncer.add((chat_guid, message))
+
+                # Update chat list with new last message
+                if chat_guid in self._chats_by_guid:
+                    chat = self._chats_by_guid[chat_guid]
+                    updated_chat = chat.model_copy(update={"last_message": message})
+                    self._chats_by_guid[chat_guid] = updated_chat
+
+                    # Move chat to top of list
+                    self._move_chat_to_front(updated_chat)
+
+                    # Refresh just this row and move it to the top
+                    row = self._rows_by_guid.get(chat_guid)
+                    if row is not None:
+                        self._update_chat_row_content(row, updated_chat)
+                        self._move_chat_row_to_top(chat_guid)
+                    else:
+                        self._request_chat_rebuild()
+
+                # Check if message already exists (might have arrived via socket)
+                if message.guid not in self._message_guids:
+                    # Add to message list
+                    self._messages.appendleft(message)
+                    self._message_guids.add(message.guid)
+                    self._messages_by_guid[message.guid] = message
+                    bubble = self._create_message_bubble(message, None)
+                    self._message_list.append(bubble)
+                    self._bubble_by_guid[message.guid] = bubble
 
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+                # Scroll to bottom
+                self._scroll_to_bottom()
+
+            return False
+
+        def on_sent(future: Future[Message | None]) -> None:
             try:
-                message = loop.run_until_complete(_send())
+                message = future.result()
             except Exception as e:
                 print(f"Error sending message: {e}")
                 message = None
-            finally:
-                loop.close()
-
-            def update_ui() -> bool:
-                if message:
-                    # Save to cache
-                    self._cache.save_messages(chat_guid, [message])
+            GLib.idle_add(update_ui, message)
 
-                    # Update chat list with new last message
-                    if chat_guid in self._chats_by_guid:
-                        chat = self._chats_by_guid[chat_guid]
-                        chat_data = chat.model_dump(by_alias=True)
-                        chat_data["lastMessage"] = message.model_dump(by_alias=True)
-                        updated_chat = Chat(**chat_data)
-                        self._chats_by_guid[chat_guid] = updated_chat
-
-                        # Move chat to top of list
-                        self._chats = [c for c in self._chats if c.guid != chat_guid]
-                        self._chats.insert(0, updated_chat)
-
-                        # Rebuild the chat list UI
-                        self._rebuild_chat_list_preserving_selection()
-
-                    # Check if message already exists (might have arrived via socket)
-                    if not any(m.guid == message.guid for m in self._messages):
-                        # Add to message list
-                        self._messages.insert(0, message)
-                        bubble = self._create_message_bubble(message, None)
-                        self._message_list.append(bubble)
-
-                    # Scroll to bottom
-                    self._scroll_to_bottom()
-
-                return False
-
-            GLib.idle_add(update_ui)
-
-        thread = threading.Thread(target=send_message, daemon=True)
-        thread.start()
+        # Runs on the shared loop; no thread is needed just to wait for it
+        self.app.async_loop.submit(_send()).add_done_callback(on_sent)
 
     def _send_pending_conversation_message(self) -> None:
         """Send the first message to create a new conversation."""
@@ -3015,79 +3191,66 @@ class MainWindow(Adw.ApplicationWindow):
 
         pending = self._pending_conversation
         addresses = pending["addresses"]
-        pending_guid = pending["guid"]
+        pending_row = pending.get("row")
 
         # Clear entry immediately - don't disable
         self._message_entry.set_text("")
 
-        def do_send() -> None:
-            async def _send() -> str | None:
-                client = self.app.get_client()
-                if client is None:
-                    return None
+        async def _send() -> Chat | None:
+            client = await self.app.get_connected_client()
+            if client is None:
+                return None
 
-                try:
-                    await client.connect()
-                    # Create new chat with message
-                    data = {
-                        "participants": addresses,
-                        "message": text,
-                        "method": "private-api",
-                    }
-                    response = await client._post("chat/new", data)
-                    if response.data:
-                        return response.data.get("guid")
-                    return None
-                finally:
-                    await client.close()
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Create new chat with message
+            data = {
+                "participants": addresses,
+                "message": text,
+                "method": "private-api",
+            }
+            response = await client._post("chat/new", data)
+            if not response.data:
+                return None
             try:
-                chat_guid = loop.run_until_complete(_send())
-
-                def update_ui() -> bool:
-                    if chat_guid:
-                        # Clear pending state
-                        self._pending_conversation = None
-
-                        # Remove the pending row from sidebar
-                        row = self._chat_list.get_row_at_index(0)
-                        while row:
-                            if hasattr(row, '_is_pending') and row._is_pending:
-                                if row._pending_guid == pending_guid:
-                                    self._chat_list.remove(row)
-                                    break
-                            row = self._chat_list.get_row_at_index(
-                                self._chat_list.get_row_at_index(0) and 1 or 0
-                            )
-                            # Simple approach: just remove first pending row
-                            break
-
-                        # Reload chats and select the new one
-                        self._load_chats()
+                return Chat(**response.data)
+            except ValueError:
+                # Chat was created but the response is incomplete; fetch it
+                return await client.get_chat(response.data["guid"])
+
+        def update_ui(new_chat: Chat | None) -> bool:
+            if new_chat:
+                # Clear pending state
+                self._pending_conversation = None
+
+                # Remove the pending row from sidebar
+                if pending_row is not None and pending_row.get_parent() is self._chat_list:
+                    self._chat_list.remove(pending_row)
+
+                # Add the chat at the top of the list (the server may have
+                # returned an existing chat) and select it right away
+                if new_chat.guid not in self._chats_by_guid:
+                    self._index_chat_participants(new_chat)
+                self._chats_by_guid[new_chat.guid] = new_chat
+                self._move_chat_to_front(new_chat)
+                self._cache.save_chat(new_chat)
+                self._sync_chat_rows()
+                self.select_chat_by_guid(new_chat.guid)
+            else:
+                # Failed - let user retry
+                self._message_entry.set_text(text)
 
-                        def select_chat() -> bool:
-                            self.select_chat_by_guid(chat_guid)
-                            return False
-                        GLib.timeout_add(300, select_chat)
-                    else:
-                        # Failed - let user retry
-                        self._message_entry.set_text(text)
+            return False
 
-                    return False
+        def show_error() -> bool:
+            self._message_entry.set_text(text)
+            return False
 
-                GLib.idle_add(update_ui)
+        def on_sent(future: Future[Chat | None]) -> None:
+            try:
+                new_chat = future.result()
             except Exception as e:
                 print(f"Error creating conversation: {e}")
-
-                def show_error() -> bool:
-                    self._message_entry.set_text(text)
-                    return False
-
                 GLib.idle_add(show_error)
-            finally:
-                loop.close()
+                return
+            GLib.idle_add(update_ui, new_chat)
 
-        thread = threading.Thread(target=do_send, daemon=True)
-        thread.start()
+        self.app.async_loop.submit(_send()).add_done_callback(on_sent)
@@ -7,8 +7,12 @@ import json
 import os
 import socket
 import threading
+import weakref
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import gi
 
@@ -30,16 +34,151 @@ from ..api import BlueBubblesClient
 from ..api.models import Chat, Message
 from ..api.websocket import BlueBubblesSocket
 from ..state.cache import Cache
+from ..utils.async_loop import BackgroundLoop
 from ..utils.config import Config
+from ..utils.contacts import build_contact_index, lookup_contact_name
+from ..utils.debounce import CallDebouncer
+from ..utils.timefmt import format_message_time
+from .widgets.containers import remove_all_children
 
 
 # IPC socket path
 SOCKET_PATH = Path(os.environ.get("XDG_RUNTIME_DIR", "/tmp")) / "bluebubbles-panel.sock"
 
+# Reply to IPC commands that don't return data
+_IPC_OK = b"ok\n"
+
+# Replies to the status command (JSON), serialized once
+_IPC_STATUS_VISIBLE = json.dumps({"visible": True}).encode() + b"\n"
+_IPC_STATUS_HIDDEN = json.dumps({"visible": False}).encode() + b"\n"
+
 
 # Panel position setting file
 PANEL_CONFIG_PATH = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "bluebubbles" / "panel.json"
 
+# Most chats shown in the panel's list
+_MAX_CHAT_ROWS = 50
+
+# Most messages kept for the open conversation; older ones are dropped
+_MAX_MESSAGES = 500
+
+# Messages fetched per conversation
+_MESSAGE_PAGE_SIZE = 30
+
+# Chats above and below the open one whose messages are prefetched
+_PREFETCH_NEIGHBORS = 1
+
+# Layer shell edges anchored for each panel position; the first one is
+# the edge the panel slides in from
+_PANEL_EDGES: dict[str, tuple[str, ...]] = {
+    "left": ("LEFT", "TOP", "BOTTOM"),
+    "right": ("RIGHT", "TOP", "BOTTOM"),
+    "top": ("TOP", "LEFT", "RIGHT"),
+    "bottom": ("BOTTOM", "LEFT", "RIGHT"),
+}
+
+T = TypeVar("T")
+
+_PANEL_CSS = b"""
+    .panel-window {
+        background-color: alpha(@window_bg_color, 0.95);
+    }
+    .message-bubble-sent {
+        background-color: #007AFF;
+        color: white;
+        border-radius: 18px;
+        padding: 10px 14px;
+        margin: 2px 12px 2px 60px;
+    }
+    .message-bubble-sent label {
+        color: white;
+    }
+    .status-label-sent {
+        color: rgba(255, 255, 255, 0.7);
+    }
+    .message-bubble-received {
+        color: #333333;
+        border-radius: 18px;
+        padding: 10px 14px;
+        margin: 2px 60px 2px 12px;
+    }
+    .sender-name-panel {
+        font-weight: 600;
+    }
+"""
+
+# Sender colors for message bubbles (same as main app)
+_SENDER_COLORS = (
+    "#ffc7c7",  # Light pink/coral
+    "#ffe7c7",  # Light peach
+    "#f9ffc7",  # Light yellow
+    "#c7ffcb",  # Light green
+    "#c7f4ff",  # Light blue
+    "#e7c7ff",  # Light purple
+    "#ffc7e7",  # Light rose
+    "#c7ffe7",  # Light mint
+)
+
+# One bubble and sender name class per color, so rows only pick a class
+_PANEL_CSS += "".join(
+    f".message-bubble-received-{i} {{ background-color: {color}; }}\n"
+    f".sender-name-panel-{i} {{ color: darker({color}); }}\n"
+    for i, color in enumerate(_SENDER_COLORS)
+).encode()
+
+# Parsed once per process and registered once per display
+_css_provider: Gtk.CssProvider | None = None
+_css_displays: weakref.WeakSet[Gdk.Display] = weakref.WeakSet()
+
+
+def _single_line_text(text: str) -> Gtk.Widget:
+    """
+    Create a left-aligned, end-ellipsized line of text.
+
+    Uses Gtk.Inscription (GTK 4.8+) when available: its size comes from a
+    character count rather than a Pango layout of the text, so rows don't
+    re-measure their text on every layout pass. Both widgets support
+    get_text()/set_text().
+    """
+    if hasattr(Gtk, "Inscription"):
+        inscription = Gtk.Inscription(text=text, xalign=0)
+        inscription.set_min_chars(10)
+        inscription.set_nat_chars(40)
+        inscription.set_text_overflow(Gtk.InscriptionOverflow.ELLIPSIZE_END)
+        return inscription
+    label = Gtk.Label(label=text, xalign=0)
+    label.set_ellipsize(3)  # END
+    return label
+
+
+def _contact_display_name(contact_index: dict[str, str], address: str) -> str:
+    """Find the contact name for an address in an index, falling back to the address."""
+    return lookup_contact_name(contact_index, address) or address
+
+
+def _resolve_sender(msg: Message, contact_index: dict[str, str]) -> str:
+    """Get the sender label for a message bubble ("" for our own messages)."""
+    if msg.is_from_me:
+        return ""
+    if msg.handle is None:
+        return "Unknown"
+    return _contact_display_name(contact_index, msg.handle.address)
+
+
+def _sender_color_index(sender_name: str) -> int:
+    """Get a consistent _SENDER_COLORS index for a sender."""
+    return hash(sender_name) % len(_SENDER_COLORS)
+
+
+@dataclass(slots=True)
+class _MessageRowData:
+    """Display values for a message bubble, computed before its row is built."""
+
+    message: Message
+    time_str: str
+    sender_name: str
+    color_index: int
+
 
 class SidePanelApplication(Adw.Application):
     """Side panel application for quick messaging."""
@@ -52,8 +191,18 @@ class SidePanelApplication(Adw.Application):
         self.config = Config()
         self.position = position
         self._panel_window: SidePanelWindow | None = None
-        self._ipc_server: socket.socket | None = None
-        self._ipc_thread: threading.Thread | None = None
+        self._ipc_service: Gio.SocketService | None = None
+        # IPC command -> handler returning the reply, bound once
+        self._ipc_handlers: dict[bytes, Callable[[], bytes]] = {
+            b"toggle": self._do_toggle,
+            b"show": self._do_show,
+            b"hide": self._do_hide,
+            b"status": self._do_status,
+        }
+
+        # One persistent event loop for all network work
+        self.async_loop = BackgroundLoop("bluebubbles-panel-async")
+        self.client: BlueBubblesClient | None = None
 
     def do_activate(self) -> None:
         """Called when the application is activated."""
@@ -70,8 +219,30 @@ class SidePanelApplication(Adw.Application):
     def do_shutdown(self) -> None:
         """Called when the application shuts down."""
         self._stop_ipc_server()
+        if self.client is not None:
+            try:
+                self.async_loop.run(self.client.close(), timeout=2.0)
+            except Exception as e:
+                print(f"Error closing API client: {e}")
         Adw.Application.do_shutdown(self)
 
+    async def get_connected_client(self) -> BlueBubblesClient | None:
+        """Get the shared API client, connecting it on first use.
+
+        Must be awaited on the background loop: the client's connection pool
+        is bound to it and reused by every request instead of reconnecting.
+        """
+        if not self.config.is_configured:
+            return None
+
+        if self.client is None:
+            self.client = BlueBubblesClient(
+                self.config.server_url,  # type: ignore
+                self.config.password,  # type: ignore
+            )
+        await self.client.connect()  # No-op once connected
+        return self.client
+
     def _setup_actions(self) -> None:
         """Set up application actions."""
         quit_action = Gio.SimpleAction.new("quit", None)
@@ -84,58 +255,108 @@ class SidePanelApplication(Adw.Application):
 
     def _on_toggle(self, _action: Any, _param: Any) -> None:
         """Toggle panel visibility with slide animation."""
-        if self._panel_window:
+        if self._panel_window is not None:
             if self._panel_window._is_shown:
                 self._panel_window.slide_out()
             else:
                 self._panel_window.slide_in()
 
     def _start_ipc_server(self) -> None:
-        """Start the IPC server for toggle commands."""
+        """Start the IPC server for toggle commands.
+
+        The socket is served by the GLib main loop, so commands are handled
+        on the UI thread without a dedicated accept thread.
+        """
         # Remove existing socket
         if SOCKET_PATH.exists():
             SOCKET_PATH.unlink()
 
-        self._ipc_server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        self._ipc_server.bind(str(SOCKET_PATH))
-        self._ipc_server.listen(1)
-        self._ipc_server.setblocking(False)
-
-        def ipc_loop() -> None:
-            while self._ipc_server:
-                try:
-                    conn, _ = self._ipc_server.accept()
-                    data = conn.recv(1024).decode().strip()
-                    if data == "toggle":
-                        GLib.idle_add(self._on_toggle, None, None)
-                        conn.send(b"ok\n")
-                    elif data == "show":
-                        GLib.idle_add(lambda: self._panel_window and self._panel_window.slide_in())
-                        conn.send(b"ok\n")
-                    elif data == "hide":
-                        GLib.idle_add(lambda: self._panel_window and self._panel_window.slide_out())
-                        conn.send(b"ok\n")
-                    elif data == "status":
-                        visible = self._panel_window._is_shown if self._panel_window else False
-                        conn.send(f"{{'visible': {str(visible).lower()}}}\n".encode())
-                    conn.close()
-                except BlockingIOError:
-                    import time
-                    time.sleep(0.1)
-                except Exception:
-                    break
+        self._ipc_service = Gio.SocketService.new()
+        self._ipc_service.add_address(
+            Gio.UnixSocketAddress.new(str(SOCKET_PATH)),
+            Gio.SocketType.STREAM,
+            Gio.SocketProtocol.DEFAULT,
+            None,
+        )
+        self._ipc_service.connect("incoming", self._on_ipc_incoming)
+        self._ipc_service.start()
+
+    def _on_ipc_incoming(
+        self, _service: Gio.SocketService, connection: Gio.SocketConnection, _source: Any
+    ) -> bool:
+        """Read the command from a new IPC connection."""
+        # Commands are newline-terminated; reading a whole line means a
+        # command split across writes isn't cut short by a single read.
+        # Passing the connection along keeps it alive until the reply is sent.
+        stream = Gio.DataInputStream.new(connection.get_input_stream())
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, None, self._on_ipc_command_read, connection)
+        return True
+
+    def _on_ipc_command_read(
+        self, stream: Gio.DataInputStream, result: Gio.AsyncResult, connection: Gio.SocketConnection
+    ) -> None:
+        """Run a received IPC command and send its reply."""
+        try:
+            # Commands are ASCII, so they are matched as bytes without decoding
+            line, _length = stream.read_line_finish(result)
+            data = (line or b"").strip()
+        except GLib.Error as e:
+            print(f"IPC read error: {e}")
+            connection.close(None)
+            return
 
-        self._ipc_thread = threading.Thread(target=ipc_loop, daemon=True)
-        self._ipc_thread.start()
+        reply = self._handle_ipc_command(data)
+        if reply is None:
+            connection.close(None)
+            return
+
+        connection.get_output_stream().write_bytes_async(
+            GLib.Bytes.new(reply), GLib.PRIORITY_DEFAULT, None, self._on_ipc_reply_written, connection
+        )
+
+    def _on_ipc_reply_written(
+        self, stream: Gio.OutputStream, result: Gio.AsyncResult, connection: Gio.SocketConnection
+    ) -> None:
+        """Close an IPC connection once its reply is written."""
+        try:
+            stream.write_bytes_finish(result)
+        except GLib.Error as e:
+            print(f"IPC write error: {e}")
+        connection.close(None)
+
+    def _handle_ipc_command(self, command: bytes) -> bytes | None:
+        """Execute an IPC command and return the reply (None for unknown commands)."""
+        handler = self._ipc_handlers.get(command)
+        return handler() if handler is not None else None
+
+    def _do_toggle(self) -> bytes:
+        """IPC: toggle the panel."""
+        self._on_toggle(None, None)
+        return _IPC_OK
+
+    def _do_show(self) -> bytes:
+        """IPC: slide the panel in."""
+        if self._panel_window is not None:
+            self._panel_window.slide_in()
+        return _IPC_OK
+
+    def _do_hide(self) -> bytes:
+        """IPC: slide the panel out."""
+        if self._panel_window is not None:
+            self._panel_window.slide_out()
+        return _IPC_OK
+
+    def _do_status(self) -> bytes:
+        """IPC: report whether the panel is shown."""
+        visible = self._panel_window._is_shown if self._panel_window is not None else False
+        return _IPC_STATUS_VISIBLE if visible else _IPC_STATUS_HIDDEN
 
     def _stop_ipc_server(self) -> None:
         """Stop the IPC server."""
-        if self._ipc_server:
-            try:
-                self._ipc_server.close()
-            except Exception:
-                pass
-            self._ipc_server = None
+        if self._ipc_service:
+            self._ipc_service.stop()
+            self._ipc_service.close()
+            self._ipc_service = None
 
         if SOCKET_PATH.exists():
             try:
@@ -159,14 +380,43 @@ class SidePanelWindow(Adw.ApplicationWindow):
         self._config = application.config
         self._position = position
         self._chats: list[Chat] = []
+        self._chats_by_guid: dict[str, Chat] = {}
+        self._chat_guid_by_identifier: dict[str, str] = {}  # chat_identifier -> guid
+        self._rows_by_guid: dict[str, Gtk.ListBoxRow] = {}  # chat_guid -> row widget
         self._selected_chat: Chat | None = None
         self._contacts: dict[str, str] = {}
-        self._messages: list[Message] = []
+        self._contact_index: dict[str, str] = {}  # raw and canonical address -> name
+        self._display_name_cache: dict[str, str] = {}  # address -> display name
+        # (guid, first three participant addresses, participant count) -> title
+        self._chat_title_cache: dict[tuple[str, tuple[str, ...], int], str] = {}
+        self._sender_color_cache: dict[str, int] = {}  # sender name -> _SENDER_COLORS index
+        self._messages: dict[str, Message] = {}  # guid -> message, oldest first
+        self._message_rows: dict[str, Gtk.ListBoxRow] = {}  # guid -> row widget
+        # chat guid -> rows fetched ahead of time for chats next to the open one
+        self._prefetched_messages: dict[str, list[_MessageRowData]] = {}
         self._is_animating = False
         self._is_shown = False  # Track logical visibility (not GTK visibility)
         self._slide_animation: Adw.TimedAnimation | None = None
         self._socket: BlueBubblesSocket | None = None
-        self._socket_thread: threading.Thread | None = None
+        self._socket_future: Future[None] | None = None
+
+        # Socket messages waiting to be applied in one idle callback
+        self._incoming_lock = threading.Lock()
+        self._incoming_messages: list[tuple[Message, str]] = []
+        self._incoming_flush_pending = False
+
+        # Whether the message list follows new messages (user is at the bottom)
+        self._autoscroll = True
+        # Whether to focus the chat list when its page is next shown
+        self._focus_list_on_show = False
+
+        # Only the last of several quickly opened chats fetches its messages
+        self._load_messages_debouncer = CallDebouncer(
+            callback=self._load_selected_messages,
+            delay_ms=120,
+            scheduler=lambda cb: GLib.timeout_add(120, cb),
+            cancel_scheduler=GLib.source_remove,
+        )
 
         self._setup_window()
         self._build_ui()
@@ -196,35 +446,11 @@ class SidePanelWindow(Adw.ApplicationWindow):
                 return
             Gtk4LayerShell.set_layer(self, Gtk4LayerShell.Layer.TOP)
 
-            # Configure anchoring based on position
-            if self._position == "left":
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.LEFT, True)
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.TOP, True)
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.BOTTOM, True)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.LEFT, 10)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.TOP, 10)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.BOTTOM, 10)
-            elif self._position == "right":
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.RIGHT, True)
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.TOP, True)
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.BOTTOM, True)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.RIGHT, 10)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.TOP, 10)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.BOTTOM, 10)
-            elif self._position == "top":
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.TOP, True)
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.LEFT, True)
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.RIGHT, True)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.TOP, 10)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.LEFT, 10)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.RIGHT, 10)
-            elif self._position == "bottom":
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.BOTTOM, True)
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.LEFT, True)
-                Gtk4LayerShell.set_anchor(self, Gtk4LayerShell.Edge.RIGHT, True)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.BOTTOM, 10)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.LEFT, 10)
-                Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.RIGHT, 10)
+            # Anchor and inset the panel on its own edge plus the two beside it
+            for edge_name in _PANEL_EDGES.get(self._position, ()):
+                edge = getattr(Gtk4LayerShell.Edge, edge_name)
+                Gtk4LayerShell.set_anchor(self, edge, True)
+                Gtk4LayerShell.set_margin(self, edge, 10)
 
             # Set namespace for window rules
             Gtk4LayerShell.set_namespace(self, "bluebubbles-panel")
@@ -242,15 +468,9 @@ class SidePanelWindow(Adw.ApplicationWindow):
 
     def _get_slide_edge(self) -> "Gtk4LayerShell.Edge | None":
         """Get the edge to animate for sliding."""
-        if not self._layer_shell_active:
+        if not self._layer_shell_active or self._position not in _PANEL_EDGES:
             return None
-        edge_map = {
-            "left": Gtk4LayerShell.Edge.LEFT,
-            "right": Gtk4LayerShell.Edge.RIGHT,
-            "top": Gtk4LayerShell.Edge.TOP,
-            "bottom": Gtk4LayerShell.Edge.BOTTOM,
-        }
-        return edge_map.get(self._position)
+        return getattr(Gtk4LayerShell.Edge, _PANEL_EDGES[self._position][0])
 
     def _set_slide_margin(self, value: float) -> None:
         """Set the margin for slide animation."""
@@ -285,21 +505,22 @@ class SidePanelWindow(Adw.ApplicationWindow):
             target,
         )
         self._slide_animation.set_easing(Adw.Easing.EASE_OUT_CUBIC)
-
-        def on_done(_anim: Adw.TimedAnimation) -> None:
-            self._is_animating = False
-            self._is_shown = True
-            # Enable keyboard input when fully shown
-            if self._layer_shell_active:
-                Gtk4LayerShell.set_keyboard_mode(
-                    self, Gtk4LayerShell.KeyboardMode.ON_DEMAND
-                )
-
-        self._slide_animation.connect("done", on_done)
+        self._slide_animation.connect("done", self._on_slide_in_done)
         self._slide_animation.play()
 
+    def _on_slide_in_done(self, _anim: Adw.TimedAnimation) -> None:
+        """Finish sliding in and take keyboard input."""
+        self._is_animating = False
+        self._is_shown = True
+        self._slide_animation = None
+        # Enable keyboard input when fully shown
+        if self._layer_shell_active:
+            Gtk4LayerShell.set_keyboard_mode(
+                self, Gtk4LayerShell.KeyboardMode.ON_DEMAND
+            )
+
     def slide_out(self) -> None:
-        """Slide the panel out of view (stays off-screen, no fade)."""
+        """Slide the panel out of view, then unmap it (no fade)."""
         if not self._is_shown or self._is_animating:
             return
 
@@ -324,9 +545,17 @@ class SidePanelWindow(Adw.ApplicationWindow):
             target,
         )
         self._slide_animation.set_easing(Adw.Easing.EASE_IN_CUBIC)
-        self._slide_animation.connect("done", lambda _: setattr(self, "_is_animating", False))
+        self._slide_animation.connect("done", self._on_slide_out_done)
         self._slide_animation.play()
 
+    def _on_slide_out_done(self, _anim: Adw.TimedAnimation) -> None:
+        """Finish sliding out and unmap the panel."""
+        self._is_animating = False
+        self._slide_animation = None
+        # Unmap once off-screen so the compositor stops drawing the panel;
+        # set_visible() skips our hide() override, slide_in() re-presents
+        Gtk.Widget.set_visible(self, False)
+
     def present(self) -> None:
         """Override present to slide in."""
         self.slide_in()
@@ -408,6 +637,7 @@ class SidePanelWindow(Adw.ApplicationWindow):
 
         # Build list page
         self._list_page = self._build_list_page()
+        self._list_page.connect("shown", self._on_list_page_shown)
         self._nav_view.add(self._list_page)
 
         # Build conversation page (added dynamically when needed)
@@ -481,6 +711,11 @@ class SidePanelWindow(Adw.ApplicationWindow):
         scrolled.set_child(self._message_list)
         content_box.append(scrolled)
 
+        # Follow new messages once layout grows the list, while at the bottom
+        self._message_adjustment = scrolled.get_vadjustment()
+        self._message_adjustment.connect("notify::upper", self._on_message_list_grown)
+        self._message_adjustment.connect("value-changed", self._on_message_list_scrolled)
+
         # Message entry
         entry_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         entry_box.set_margin_start(12)
@@ -508,18 +743,42 @@ class SidePanelWindow(Adw.ApplicationWindow):
         return page
 
     def _apply_css(self) -> None:
-        """Apply custom CSS styling."""
-        css = Gtk.CssProvider()
-        css.load_from_data(b"""
-            .panel-window {
-                background-color: alpha(@window_bg_color, 0.95);
-            }
-        """)
+        """Apply custom CSS styling (the provider is shared by all panel windows)."""
+        global _css_provider
+        if _css_provider is None:
+            _css_provider = Gtk.CssProvider()
+            if hasattr(_css_provider, "load_from_bytes"):
+                # GTK 4.12+: parse straight from the GBytes without a copy
+                _css_provider.load_from_bytes(GLib.Bytes.new(_PANEL_CSS))
+            else:
+                _css_provider.load_from_data(_PANEL_CSS)
+
+        display = self.get_display()
+        if display in _css_displays:
+            return
         Gtk.StyleContext.add_provider_for_display(
-            self.get_display(),
-            css,
+            display,
+            _css_provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
+        _css_displays.add(display)
+
+    def _run_async(self, coro: Coroutine[Any, Any, T], on_done: Callable[[T], None]) -> None:
+        """
+        Run a coroutine on the app's background loop.
+
+        on_done is called with the result on the GTK thread; if the
+        coroutine raises, the error is printed and on_done is skipped.
+        """
+        def done(future: Future[T]) -> None:
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Panel request failed: {e}")
+                return
+            GLib.idle_add(on_done, result)
+
+        self.app.async_loop.submit(coro).add_done_callback(done)
 
     def _load_data(self) -> None:
         """Load chats from cache first, then sync from server."""
@@ -532,103 +791,78 @@ class SidePanelWindow(Adw.ApplicationWindow):
 
         if cached_chats:
             self._chats = cached_chats
+            self._index_chats()
             self._contacts = cached_contacts  # Already a dict
+            self._contact_index = build_contact_index(cached_contacts)
+            self._display_name_cache.clear()
+            self._chat_title_cache.clear()
             self._update_chat_list()
 
         # Step 2: Also fetch from server to get any very recent chats not yet in cache
         # (but don't replace cache data - merge it)
-        def fetch() -> None:
-            async def _fetch() -> list[Chat]:
-                client = BlueBubblesClient(
-                    self._config.server_url,  # type: ignore
-                    self._config.password,  # type: ignore
-                )
-                try:
-                    await client.connect()
-                    chats = await client.get_chats(limit=50)
-                    return chats
-                finally:
-                    await client.close()
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                server_chats = loop.run_until_complete(_fetch())
-
-                def merge_and_update() -> bool:
-                    # Merge server chats with cached chats
-                    # Server chats may have more recent messages
-                    chats_by_guid = {c.guid: c for c in self._chats}
-                    chats_by_identifier = {c.chat_identifier: c for c in self._chats}
-
-                    for chat in server_chats:
-                        existing = chats_by_guid.get(chat.guid) or chats_by_identifier.get(chat.chat_identifier)
-                        if existing:
-                            # Update if server has newer last message
-                            if chat.last_message and existing.last_message:
-                                if chat.last_message.date_created > existing.last_message.date_created:
-                                    chats_by_guid[existing.guid] = chat
-                            elif chat.last_message and not existing.last_message:
-                                chats_by_guid[existing.guid] = chat
-                        else:
-                            # New chat not in cache
-                            chats_by_guid[chat.guid] = chat
-
-                    # Sort by last message date
-                    all_chats = list(chats_by_guid.values())
-                    all_chats.sort(
-                        key=lambda c: c.last_message.date_created if c.last_message else 0,
-                        reverse=True
-                    )
-
-                    self._chats = all_chats
-                    self._update_chat_list()
-                    return False
-
-                GLib.idle_add(merge_and_update)
-            except Exception:
-                pass  # Server fetch failed, but we have cache data
-            finally:
-                loop.close()
+        async def _fetch() -> list[Chat]:
+            client = await self.app.get_connected_client()
+            if client is None:
+                return []
+            return await client.get_chats(limit=50)
+
+        def merge_and_update(server_chats: list[Chat]) -> None:
+            # Merge server chats with cached chats
+            # Server chats may have more recent messages
+            chats_by_guid = {c.guid: c for c in self._chats}
+            chats_by_identifier = {c.chat_identifier: c for c in self._chats}
+
+            for chat in server_chats:
+                existing = chats_by_guid.get(chat.guid) or chats_by_identifier.get(chat.chat_identifier)
+                if existing:
+                    # Update if server has newer last message
+                    if chat.last_message and existing.last_message:
+                        if chat.last_message.date_created > existing.last_message.date_created:
+                            chats_by_guid[existing.guid] = chat
+                    elif chat.last_message and not existing.last_message:
+                        chats_by_guid[existing.guid] = chat
+                else:
+                    # New chat not in cache
+                    chats_by_guid[chat.guid] = chat
+
+            # Sort by last message date
+            all_chats = list(chats_by_guid.values())
+            all_chats.sort(
+                key=lambda c: c.last_message.date_created if c.last_message else 0,
+                reverse=True
+            )
 
-        thread = threading.Thread(target=fetch, daemon=True)
-        thread.start()
+            self._chats = all_chats
+            self._index_chats()
+            self._update_chat_list()
+
+        # A failed server fetch is fine, the cache data is already shown
+        self._run_async(_fetch(), merge_and_update)
 
     def _connect_socket(self) -> None:
         """Connect to BlueBubbles Socket.IO for real-time updates."""
         if not self._config.is_configured:
             return
 
-        def run_socket() -> None:
-            async def _connect() -> None:
-                self._socket = BlueBubblesSocket(
-                    self._config.server_url,  # type: ignore
-                    self._config.password,  # type: ignore
-                )
-
-                # Register callbacks
-                self._socket.on_new_message(self._on_socket_new_message)
-                self._socket.on_message_updated(self._on_socket_message_updated)
-                self._socket.on_connected(self._on_socket_connected)
-                self._socket.on_disconnected(self._on_socket_disconnected)
-
-                try:
-                    await self._socket.connect()
-                    await self._socket.wait()
-                except Exception:
-                    pass  # Connection failed or disconnected
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        async def _connect() -> None:
+            self._socket = BlueBubblesSocket(
+                self._config.server_url,  # type: ignore
+                self._config.password,  # type: ignore
+            )
+
+            # Register callbacks
+            self._socket.on_new_message(self._on_socket_new_message)
+            self._socket.on_message_updated(self._on_socket_message_updated)
+            self._socket.on_connected(self._on_socket_connected)
+            self._socket.on_disconnected(self._on_socket_disconnected)
+
             try:
-                loop.run_until_complete(_connect())
+                await self._socket.connect()
+                await self._socket.wait()
             except Exception:
-                pass
-            finally:
-                loop.close()
+                pass  # Connection failed or disconnected
 
-        self._socket_thread = threading.Thread(target=run_socket, daemon=True)
-        self._socket_thread.start()
+        self._socket_future = self.app.async_loop.submit(_connect())
 
     def _on_socket_connected(self) -> None:
         """Handle socket connection established."""
@@ -639,122 +873,221 @@ class SidePanelWindow(Adw.ApplicationWindow):
         pass  # Could show a status indicator if desired
 
     def _on_socket_new_message(self, message: Message, chat_guid: str) -> None:
-        """Handle new message from socket."""
-        def update_ui() -> bool:
-            # Skip reactions for now (keep it simple)
-            if message.is_reaction:
-                return False
-
-            # Find the chat in our list (check both guid and chat_identifier)
-            chat_index = -1
-            updated_chat: Chat | None = None
-            for i, chat in enumerate(self._chats):
-                if chat.guid == chat_guid or chat.chat_identifier == chat_guid:
-                    chat_index = i
-                    # Update last message
-                    chat_data = chat.model_dump(by_alias=True)
-                    chat_data["lastMessage"] = message.model_dump(by_alias=True)
-                    updated_chat = Chat(**chat_data)
-                    break
+        """Handle new message from socket.
 
-            if updated_chat is not None and chat_index >= 0:
-                # Move chat to top of list
-                self._chats.pop(chat_index)
-                self._chats.insert(0, updated_chat)
-                # Rebuild chat list UI
-                self._update_chat_list()
-            else:
-                # Fetch the chat from the API and add it
-                self._fetch_and_add_chat(chat_guid, message)
-
-            # If this chat is currently selected, add the message to the view
-            if self._selected_chat and (self._selected_chat.guid == chat_guid or self._selected_chat.chat_identifier == chat_guid):
-                # Check if message already exists
-                if not any(m.guid == message.guid for m in self._messages):
-                    self._messages.append(message)
-                    row = self._create_message_row(message)
-                    self._message_list.append(row)
-                    # Scroll to bottom
-                    def scroll_to_bottom() -> bool:
-                        adj = self._message_list.get_parent().get_vadjustment()  # type: ignore
-                        if adj:
-                            adj.set_value(adj.get_upper())
-                        return False
-                    GLib.timeout_add(50, scroll_to_bottom)
+        Runs on the background loop; messages are queued and applied
+        together in one idle callback rather than one hop per message.
+        """
+        with self._incoming_lock:
+            self._incoming_messages.append((message, chat_guid))
+            if self._incoming_flush_pending:
+                return
+            self._incoming_flush_pending = True
+        GLib.idle_add(self._flush_incoming_messages)
+
+    def _flush_incoming_messages(self) -> bool:
+        """Apply all queued socket messages, updating each touched chat row once."""
+        with self._incoming_lock:
+            incoming = self._incoming_messages
+            self._incoming_messages = []
+            self._incoming_flush_pending = False
+
+        # Chats touched by the batch, so each row is rebuilt/fetched once
+        changed_chats: dict[str, Chat] = {}  # guid -> updated chat, least recent first
+        unknown_chats: dict[str, Message] = {}  # chat guid -> latest message
+
+        for message, chat_guid in incoming:
+            self._apply_incoming_message(message, chat_guid, changed_chats, unknown_chats)
+
+        for chat in changed_chats.values():
+            self._move_chat_row_to_top(chat)
+        for chat_guid, message in unknown_chats.items():
+            # Fetch the chat from the API and add it
+            self._fetch_and_add_chat(chat_guid, message)
+
+        return False
+
+    def _apply_incoming_message(
+        self,
+        message: Message,
+        chat_guid: str,
+        changed_chats: dict[str, Chat],
+        unknown_chats: dict[str, Message],
+    ) -> None:
+        """
+        Apply one new socket message to the chat data and open conversation.
+
+        Chat rows are not touched here; the chat is recorded in
+        changed_chats (or unknown_chats if it isn't loaded) for the caller.
+        """
+        # Skip reactions for now (keep it simple)
+        if message.is_reaction:
+            return
+
+        # Find the chat in our list (check both guid and chat_identifier)
+        chat = self._find_chat(chat_guid)
+
+        if chat is not None:
+            # Update last message (shallow copy, no re-validation)
+            updated_chat = chat.model_copy(update={"last_message": message})
+            self._chats_by_guid[updated_chat.guid] = updated_chat
+            # Move chat to top of list
+            self._move_chat_to_front(updated_chat)
+            # Re-insert so the most recently updated chat ends up last
+            changed_chats.pop(updated_chat.guid, None)
+            changed_chats[updated_chat.guid] = updated_chat
+        else:
+            unknown_chats[chat_guid] = message
+
+        # Prefetched messages for this chat are now out of date
+        self._prefetched_messages.pop(chat.guid if chat is not None else chat_guid, None)
 
+        # If this chat is currently selected, add the message to the view
+        if self._is_selected_chat(chat_guid):
+            self._append_message(message)
+
+    def _append_message(self, message: Message) -> bool:
+        """
+        Add a message to the bottom of the open conversation.
+
+        Once more than _MAX_MESSAGES are held, the oldest are dropped
+        along with their rows.
+
+        Returns:
+            False if the message was already shown.
+        """
+        if message.guid in self._messages:
             return False
+        self._messages[message.guid] = message
+        if not message.is_reaction:
+            row = self._create_message_row(self._message_row_data(message))
+            self._message_list.append(row)
+            self._message_rows[message.guid] = row
 
-        GLib.idle_add(update_ui)
+        while len(self._messages) > _MAX_MESSAGES:
+            oldest = next(iter(self._messages))
+            del self._messages[oldest]
+            old_row = self._message_rows.pop(oldest, None)
+            if old_row is not None:
+                self._message_list.remove(old_row)
+        return True
 
     def _fetch_and_add_chat(self, chat_guid: str, message: Message) -> None:
         """Fetch a chat from the API and add it to the top of the list."""
-        def fetch() -> None:
-            async def _fetch() -> Chat | None:
-                client = BlueBubblesClient(
-                    self._config.server_url,  # type: ignore
-                    self._config.password,  # type: ignore
-                )
-                try:
-                    await client.connect()
-                    chat = await client.get_chat(chat_guid)
-                    return chat
-                except Exception:
-                    return None
-                finally:
-                    await client.close()
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        async def _fetch() -> Chat | None:
+            client = await self.app.get_connected_client()
+            if client is None:
+                return None
             try:
-                chat = loop.run_until_complete(_fetch())
-                if chat:
-                    def add_to_ui() -> bool:
-                        # Update last message
-                        chat_data = chat.model_dump(by_alias=True)
-                        chat_data["lastMessage"] = message.model_dump(by_alias=True)
-                        updated_chat = Chat(**chat_data)
-                        # Add to top of list
-                        self._chats.insert(0, updated_chat)
-                        self._update_chat_list()
-                        return False
-                    GLib.idle_add(add_to_ui)
-            finally:
-                loop.close()
-
-        thread = threading.Thread(target=fetch, daemon=True)
-        thread.start()
+                return await client.get_chat(chat_guid)
+            except Exception:
+                return None
+
+        def add_to_ui(chat: Chat | None) -> None:
+            if not chat:
+                return
+            # Update last message
+            updated_chat = chat.model_copy(update={"last_message": message})
+            # Add to top of list
+            self._chats_by_guid[updated_chat.guid] = updated_chat
+            self._chat_guid_by_identifier[updated_chat.chat_identifier] = updated_chat.guid
+            self._move_chat_to_front(updated_chat)
+            self._move_chat_row_to_top(updated_chat)
+
+        self._run_async(_fetch(), add_to_ui)
 
     def _on_socket_message_updated(self, message: Message, chat_guid: str) -> None:
         """Handle message update from socket (e.g., read receipts)."""
+        # Updates for background chats are the common case; drop them here
+        # instead of waking the UI thread for nothing
+        if not self._is_selected_chat(chat_guid):
+            return
+
         def update_ui() -> bool:
-            # Update the message in our list if it exists
-            if self._selected_chat and (self._selected_chat.guid == chat_guid or self._selected_chat.chat_identifier == chat_guid):
-                for i, msg in enumerate(self._messages):
-                    if msg.guid == message.guid:
-                        self._messages[i] = message
-                        break
+            # The selection may have changed before this ran
+            if self._is_selected_chat(chat_guid) and message.guid in self._messages:
+                self._messages[message.guid] = message
             return False
 
         GLib.idle_add(update_ui)
 
-    def _update_chat_list(self) -> None:
-        """Update the chat list."""
-        # Clear existing
-        while True:
-            row = self._chat_list.get_row_at_index(0)
-            if row is None:
+    def _is_selected_chat(self, guid_or_identifier: str) -> bool:
+        """Check if a socket chat GUID or identifier is the open conversation."""
+        chat = self._selected_chat
+        return chat is not None and guid_or_identifier in (chat.guid, chat.chat_identifier)
+
+    def _index_chats(self) -> None:
+        """Rebuild the chat lookup tables after self._chats is replaced."""
+        self._chats_by_guid = {c.guid: c for c in self._chats}
+        self._chat_guid_by_identifier = {c.chat_identifier: c.guid for c in self._chats}
+
+    def _find_chat(self, guid_or_identifier: str) -> Chat | None:
+        """Find a chat by GUID or chat identifier (socket events may use either)."""
+        chat = self._chats_by_guid.get(guid_or_identifier)
+        if chat is None:
+            guid = self._chat_guid_by_identifier.get(guid_or_identifier)
+            if guid is not None:
+                chat = self._chats_by_guid.get(guid)
+        return chat
+
+    def _move_chat_to_front(self, chat: Chat) -> None:
+        """Move (or add) a chat at the front of self._chats in place."""
+        chats = self._chats
+        # Active chats are usually near the front, so this scan stops early
+        for i, c in enumerate(chats):
+            if c.guid == chat.guid:
+                del chats[i]
                 break
-            self._chat_list.remove(row)
+        chats.insert(0, chat)
+
+    def _update_chat_list(self) -> None:
+        """
+        Rebuild the whole chat list (initial load and refresh).
+
+        Rows of chats that were already listed are updated and reused, so a
+        refresh that mostly reorders chats builds few new widget trees.
+        """
+        # Clear existing; the old rows stay alive in old_rows for reuse
+        old_rows = self._rows_by_guid
+        remove_all_children(self._chat_list)
+        self._rows_by_guid = {}
 
         # Only display top 50 chats for performance
-        for chat in self._chats[:50]:
-            row = self._create_chat_row(chat)
+        for chat in self._chats[:_MAX_CHAT_ROWS]:
+            row = old_rows.pop(chat.guid, None)
+            if row is None:
+                row = self._create_chat_row(chat)
+            else:
+                self._update_chat_row(row, chat)
+                self._rows_by_guid[chat.guid] = row
             self._chat_list.append(row)
 
+    def _move_chat_row_to_top(self, chat: Chat) -> None:
+        """Show an updated chat at the top of the list, reusing its row if it has one."""
+        row = self._rows_by_guid.get(chat.guid)
+        if row is not None and row.get_parent() is self._chat_list:
+            self._update_chat_row(row, chat)
+            if row.get_index() != 0:
+                was_selected = self._chat_list.get_selected_row() is row
+                self._chat_list.remove(row)
+                self._chat_list.prepend(row)
+                if was_selected:
+                    self._chat_list.select_row(row)
+        else:
+            self._chat_list.prepend(self._create_chat_row(chat))
+
+        # Keep the list capped
+        overflow = self._chat_list.get_row_at_index(_MAX_CHAT_ROWS)
+        if overflow is not None:
+            self._chat_list.remove(overflow)
+            if self._rows_by_guid.get(overflow.chat.guid) is overflow:  # type: ignore
+                del self._rows_by_guid[overflow.chat.guid]  # type: ignore
+
     def _create_chat_row(self, chat: Chat) -> Gtk.ListBoxRow:
         """Create a compact chat row."""
         row = Gtk.ListBoxRow()
         row.chat = chat  # type: ignore
+        self._rows_by_guid[chat.guid] = row
 
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         box.set_margin_start(10)
@@ -773,20 +1106,11 @@ class SidePanelWindow(Adw.ApplicationWindow):
         text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
         text_box.set_hexpand(True)
 
-        name_label = Gtk.Label(label=title, xalign=0)
-        name_label.set_ellipsize(3)
+        name_label = _single_line_text(title)
         text_box.append(name_label)
 
         # Preview
-        if chat.last_message:
-            preview = chat.last_message.text or "(attachment)"
-            if len(preview) > 40:
-                preview = preview[:37] + "..."
-        else:
-            preview = ""
-
-        preview_label = Gtk.Label(label=preview, xalign=0)
-        preview_label.set_ellipsize(3)
+        preview_label = _single_line_text(self._get_chat_preview(chat))
         preview_label.add_css_class("dim-label")
         preview_label.add_css_class("caption")
         text_box.append(preview_label)
@@ -794,63 +1118,59 @@ class SidePanelWindow(Adw.ApplicationWindow):
         box.append(text_box)
 
         row.set_child(box)
-        return row
-
-    def _normalize_phone(self, phone: str) -> list[str]:
-        """
-        Normalize a phone number for comparison (remove formatting).
-        Returns multiple variants to handle country code differences.
-        """
-        import re
-        # Remove all non-digit characters
-        digits_only = re.sub(r"[^\d]", "", phone)
 
-        variants = []
-
-        # Add the digits-only version
-        if digits_only:
-            variants.append(digits_only)
-
-            # If it starts with country code 1 (US/Canada), also try without it
-            if digits_only.startswith("1") and len(digits_only) == 11:
-                variants.append(digits_only[1:])  # Without country code
-
-            # If it's 10 digits, also try with +1 prefix
-            if len(digits_only) == 10:
-                variants.append("1" + digits_only)  # With country code
-                variants.append("+1" + digits_only)  # With + prefix
-
-            # Also add +digits version
-            variants.append("+" + digits_only)
+        # Keep widget references so the row can be updated in place
+        row._avatar = avatar  # type: ignore
+        row._name_label = name_label  # type: ignore
+        row._preview_label = preview_label  # type: ignore
+        return row
 
-        return variants
+    def _update_chat_row(self, row: Gtk.ListBoxRow, chat: Chat) -> None:
+        """Show a chat's current title and last message in an existing row."""
+        row.chat = chat  # type: ignore
+        title = self._get_chat_title(chat)
+        if row._name_label.get_text() != title:  # type: ignore
+            row._avatar.set_text(title)  # type: ignore
+            row._name_label.set_text(title)  # type: ignore
+        row._preview_label.set_text(self._get_chat_preview(chat))  # type: ignore
+
+    def _get_chat_preview(self, chat: Chat) -> str:
+        """Get the shortened last message text shown under a chat's title."""
+        if not chat.last_message:
+            return ""
+        preview = chat.last_message.text or "(attachment)"
+        if len(preview) > 40:
+            preview = preview[:37] + "..."
+        return preview
 
     def _get_display_name(self, address: str) -> str:
-        """Get display name for an address, using contacts if available."""
-        # Try exact match first
-        if address in self._contacts:
-            return self._contacts[address]
-        # Try all normalized phone variants
-        for variant in self._normalize_phone(address):
-            if variant in self._contacts:
-                return self._contacts[variant]
-        # Try lowercase for emails
-        if "@" in address and address.lower() in self._contacts:
-            return self._contacts[address.lower()]
-        return address
+        """Get display name for an address, using contacts if available.
+
+        Results are memoized per address until contacts change.
+        """
+        name = self._display_name_cache.get(address)
+        if name is None:
+            name = _contact_display_name(self._contact_index, address)
+            self._display_name_cache[address] = name
+        return name
 
     def _get_chat_title(self, chat: Chat) -> str:
-        """Get display title for a chat, using contacts if available."""
+        """Get display title for a chat, using contacts if available.
+
+        Titles built from participant names are memoized until contacts change.
+        """
         if chat.display_name:
             return chat.display_name
         if chat.participants:
-            names = []
-            for p in chat.participants[:3]:
-                name = self._get_display_name(p.address)
-                names.append(name)
-            if len(chat.participants) > 3:
-                return ", ".join(names) + f" +{len(chat.participants) - 3}"
-            return ", ".join(names)
+            shown = tuple(p.address for p in chat.participants[:3])
+            key = (chat.guid, shown, len(chat.participants))
+            title = self._chat_title_cache.get(key)
+            if title is None:
+                title = ", ".join(self._get_display_name(address) for address in shown)
+                if len(chat.participants) > 3:
+                    title += f" +{len(chat.participants) - 3}"
+                self._chat_title_cache[key] = title
+            return title
         return chat.chat_identifier
 
     def _on_chat_activated(self, _listbox: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
@@ -866,193 +1186,193 @@ class SidePanelWindow(Adw.ApplicationWindow):
         self._conv_title.set_text(title)
 
         # Clear previous messages
-        while True:
-            row = self._message_list.get_row_at_index(0)
-            if row is None:
-                break
-            self._message_list.remove(row)
+        remove_all_children(self._message_list)
+        self._messages = {}
+        self._message_rows = {}
 
         # Navigate to conversation page
         self._nav_view.push(self._conversation_page)
 
-        # Load messages
-        self._load_messages(chat.guid)
+        # Load messages once the selection settles
+        self._load_messages_debouncer.call()
 
         # NOTE: Don't call grab_focus() - it causes text entry issues
         # The user can click on the entry to focus it
 
+    def _load_selected_messages(self) -> None:
+        """Load messages for the open conversation (debounced)."""
+        if self._selected_chat is not None:
+            self._load_messages(self._selected_chat.guid)
+
+    async def _fetch_message_rows(self, chat_guid: str) -> list[_MessageRowData]:
+        """Fetch a chat's latest messages as row data (on the background loop)."""
+        client = await self.app.get_connected_client()
+        if client is None:
+            return []
+        messages = await client.get_chat_messages(chat_guid, limit=_MESSAGE_PAGE_SIZE)
+        # Oldest first (the list is ours, so reverse it in place); reactions
+        # aren't shown. Formatting happens here so the UI thread only has to
+        # build widgets.
+        messages.reverse()
+        # _load_data replaces the index rather than mutating it, so this
+        # reference stays consistent while we format
+        contact_index = self._contact_index
+        return [
+            self._message_row_data(m, contact_index)
+            for m in messages
+            if not m.is_reaction
+        ]
+
     def _load_messages(self, chat_guid: str) -> None:
         """Load messages for a chat."""
-        def fetch() -> None:
-            async def _fetch() -> list[Message]:
-                client = BlueBubblesClient(
-                    self._config.server_url,  # type: ignore
-                    self._config.password,  # type: ignore
-                )
-                try:
-                    await client.connect()
-                    messages = await client.get_chat_messages(chat_guid, limit=30)
-                    return list(reversed(messages))  # Oldest first
-                finally:
-                    await client.close()
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                messages = loop.run_until_complete(_fetch())
+        def update_ui(rows: list[_MessageRowData]) -> None:
+            # Another chat was opened while this one was loading
+            if self._selected_chat is None or self._selected_chat.guid != chat_guid:
+                return
+            self._messages = {data.message.guid: data.message for data in rows}
+            self._autoscroll = True
+            self._update_message_list(rows)
+            self._prefetch_neighbor_messages(chat_guid)
+
+        prefetched = self._prefetched_messages.pop(chat_guid, None)
+        if prefetched is not None:
+            update_ui(prefetched)
+            return
 
-                def update_ui() -> bool:
-                    self._messages = messages
-                    self._update_message_list()
-                    return False
+        self._run_async(self._fetch_message_rows(chat_guid), update_ui)
 
-                GLib.idle_add(update_ui)
-            except Exception:
-                pass
-            finally:
-                loop.close()
+    def _prefetch_neighbor_messages(self, chat_guid: str) -> None:
+        """
+        Fetch messages for the chats next to chat_guid in the list.
 
-        thread = threading.Thread(target=fetch, daemon=True)
-        thread.start()
+        Stepping through the list then shows the next conversation without
+        waiting on the network. Only the current neighbors are kept.
+        """
+        index = next((i for i, c in enumerate(self._chats) if c.guid == chat_guid), None)
+        if index is None:
+            return
+        neighbors = {
+            c.guid
+            for c in self._chats[max(index - _PREFETCH_NEIGHBORS, 0):index + _PREFETCH_NEIGHBORS + 1]
+            if c.guid != chat_guid
+        }
+        self._prefetched_messages = {
+            guid: rows for guid, rows in self._prefetched_messages.items() if guid in neighbors
+        }
+        guids = [guid for guid in neighbors if guid not in self._prefetched_messages]
+        if not guids:
+            return
+
+        async def _fetch_all() -> list[list[_MessageRowData] | BaseException]:
+            return await asyncio.gather(
+                *(self._fetch_message_rows(guid) for guid in guids),
+                return_exceptions=True,
+            )
+
+        def store(results: list[list[_MessageRowData] | BaseException]) -> None:
+            for guid, rows in zip(guids, results):
+                if isinstance(rows, BaseException):
+                    continue  # The chat will be fetched normally when opened
+                self._prefetched_messages[guid] = rows
+
+        self._run_async(_fetch_all(), store)
 
-    def _update_message_list(self) -> None:
-        """Update the message list."""
+    def _update_message_list(self, rows: list[_MessageRowData]) -> None:
+        """Replace the message list with rows for the given (non-reaction) messages."""
         # Clear existing
-        while True:
-            row = self._message_list.get_row_at_index(0)
-            if row is None:
-                break
-            self._message_list.remove(row)
+        remove_all_children(self._message_list)
 
-        for msg in self._messages:
-            # Skip reactions
-            if msg.is_reaction:
-                continue
-            row = self._create_message_row(msg)
+        self._message_rows = {}
+        for data in rows:
+            row = self._create_message_row(data)
             self._message_list.append(row)
+            self._message_rows[data.message.guid] = row
 
-        # Scroll to bottom
-        def scroll_to_bottom() -> bool:
-            adj = self._message_list.get_parent().get_vadjustment()  # type: ignore
-            if adj:
-                adj.set_value(adj.get_upper())
-            return False
-        GLib.timeout_add(100, scroll_to_bottom)
-
-    # Sender colors for message bubbles (same as main app)
-    SENDER_COLORS = [
-        "#ffc7c7",  # Light pink/coral
-        "#ffe7c7",  # Light peach
-        "#f9ffc7",  # Light yellow
-        "#c7ffcb",  # Light green
-        "#c7f4ff",  # Light blue
-        "#e7c7ff",  # Light purple
-        "#ffc7e7",  # Light rose
-        "#c7ffe7",  # Light mint
-    ]
-
-    def _get_sender_color(self, address: str) -> str:
-        """Get a consistent color for a sender based on their address."""
-        color_index = hash(address) % len(self.SENDER_COLORS)
-        return self.SENDER_COLORS[color_index]
+    def _on_message_list_grown(self, adj: Gtk.Adjustment, _pspec: Any) -> None:
+        """Scroll to the newest message after layout, if following the bottom."""
+        if self._autoscroll:
+            adj.set_value(adj.get_upper() - adj.get_page_size())
+
+    def _on_message_list_scrolled(self, adj: Gtk.Adjustment) -> None:
+        """Keep following new messages only while scrolled to the bottom."""
+        self._autoscroll = adj.get_value() >= adj.get_upper() - adj.get_page_size() - 20
+
+    def _get_sender_color_index(self, sender_name: str) -> int:
+        """Get a sender's _SENDER_COLORS index, memoized per sender."""
+        color_index = self._sender_color_cache.get(sender_name)
+        if color_index is None:
+            color_index = _sender_color_index(sender_name)
+            self._sender_color_cache[sender_name] = color_index
+        return color_index
 
     def _get_sender_name(self, msg: Message) -> str:
-        """Get display name for message sender."""
-        if msg.handle:
-            return self._get_display_name(msg.handle.address)
-        return "Unknown"
+        """Get the sender label for a message bubble, memoizing contact lookups."""
+        if msg.is_from_me or msg.handle is None:
+            return _resolve_sender(msg, self._contact_index)
+        return self._get_display_name(msg.handle.address)
+
+    def _message_row_data(
+        self, msg: Message, contact_index: dict[str, str] | None = None
+    ) -> _MessageRowData:
+        """
+        Compute the display values for a message bubble.
 
-    def _create_message_row(self, msg: Message) -> Gtk.ListBoxRow:
+        Touches no widgets. On the background loop, pass a snapshot of the
+        contact index: the sender is then resolved against it directly and
+        the memo caches (owned by the UI thread) are left alone.
+        """
+        if contact_index is None:
+            sender_name = self._get_sender_name(msg)
+            color_index = self._get_sender_color_index(sender_name)
+        else:
+            sender_name = _resolve_sender(msg, contact_index)
+            color_index = _sender_color_index(sender_name)
+        return _MessageRowData(
+            message=msg,
+            time_str=format_message_time(msg.date_created),
+            sender_name=sender_name,
+            color_index=color_index,
+        )
+
+    def _create_message_row(self, data: _MessageRowData) -> Gtk.ListBoxRow:
         """Create a message bubble row (matching main app style)."""
+        msg = data.message
         row = Gtk.ListBoxRow()
         row.set_activatable(False)
         row.set_selectable(False)
 
-        container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        container.set_margin_top(2)
-        container.set_margin_bottom(2)
-
-        outer_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-
         is_group = self._selected_chat and self._selected_chat.is_group
 
-        bubble = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        # The bubble is a single-column grid placed directly in the row: a
+        # grid measures its children once per pass, where nested boxes
+        # re-measure while distributing space
+        bubble = Gtk.Grid(row_spacing=2)
+        lines: list[Gtk.Widget] = []
 
         if msg.is_from_me:
             # Sent message - blue/right aligned
-            bubble.set_margin_start(60)
-            bubble.set_margin_end(12)
             bubble.set_halign(Gtk.Align.END)
-            outer_box.set_halign(Gtk.Align.END)
-
-            # Apply iMessage blue style
-            css_provider = Gtk.CssProvider()
-            css_provider.load_from_data(b"""
-                .message-bubble-sent {
-                    background-color: #007AFF;
-                    color: white;
-                    border-radius: 18px;
-                    padding: 10px 14px;
-                }
-                .message-bubble-sent label {
-                    color: white;
-                }
-                .status-label-sent {
-                    color: rgba(255, 255, 255, 0.7);
-                }
-            """)
-            Gtk.StyleContext.add_provider_for_display(
-                self.get_display(),
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
+
+            # iMessage blue style and margins (defined in _PANEL_CSS)
             bubble.add_css_class("message-bubble-sent")
         else:
             # Received message - colored based on sender
-            bubble.set_margin_start(12)
-            bubble.set_margin_end(60)
             bubble.set_halign(Gtk.Align.START)
-            outer_box.set_halign(Gtk.Align.START)
 
-            sender_address = self._get_sender_name(msg)
-            sender_color = self._get_sender_color(sender_address)
+            color_index = data.color_index
 
             # Show sender name in group chats
             if is_group:
-                sender_label = Gtk.Label(label=sender_address, xalign=0)
+                sender_label = _single_line_text(data.sender_name)
                 sender_label.add_css_class("caption")
                 sender_label.set_margin_bottom(2)
-                name_css = Gtk.CssProvider()
-                name_css.load_from_data(f"""
-                    .sender-name-panel {{
-                        color: darker({sender_color});
-                        font-weight: 600;
-                    }}
-                """.encode())
-                Gtk.StyleContext.add_provider_for_display(
-                    self.get_display(),
-                    name_css,
-                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
                 sender_label.add_css_class("sender-name-panel")
-                bubble.append(sender_label)
-
-            # Apply colored bubble style
-            bubble_css = Gtk.CssProvider()
-            bubble_css.load_from_data(f"""
-                .message-bubble-received {{
-                    background-color: {sender_color};
-                    color: #333333;
-                    border-radius: 18px;
-                    padding: 10px 14px;
-                }}
-            """.encode())
-            Gtk.StyleContext.add_provider_for_display(
-                self.get_display(),
-                bubble_css,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
+                sender_label.add_css_class(f"sender-name-panel-{color_index}")
+                lines.append(sender_label)
+
+            # Colored bubble style and margins (defined once in _PANEL_CSS)
             bubble.add_css_class("message-bubble-received")
+            bubble.add_css_class(f"message-bubble-received-{color_index}")
 
         # Message text
         if msg.text:
@@ -1061,51 +1381,47 @@ class SidePanelWindow(Adw.ApplicationWindow):
             text_label.set_wrap_mode(2)  # WORD_CHAR
             text_label.set_max_width_chars(30)
             text_label.set_selectable(True)
-            bubble.append(text_label)
+            lines.append(text_label)
         elif msg.has_attachments:
             text_label = Gtk.Label(label="(attachment)", xalign=0)
             text_label.add_css_class("dim-label")
-            bubble.append(text_label)
+            lines.append(text_label)
 
-        # Time row
-        status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-        time_str = msg.date_created_dt.strftime("%I:%M %p")
+        # Time row; one label (with the sender in 1:1 chats) rather than a
+        # box of separate labels, to keep each row's widget tree small
+        time_str = data.time_str
         time_label = Gtk.Label(label=time_str)
         time_label.add_css_class("caption")
 
         if msg.is_from_me:
             time_label.add_css_class("status-label-sent")
-            status_box.set_halign(Gtk.Align.END)
+            time_label.set_halign(Gtk.Align.END)
         else:
-            status_box.set_halign(Gtk.Align.START)
+            time_label.set_halign(Gtk.Align.START)
             if not is_group:
-                sender_name = self._get_sender_name(msg)
-                sender_status = Gtk.Label(label=sender_name)
-                sender_status.add_css_class("caption")
-                sender_status.add_css_class("dim-label")
-                status_box.append(sender_status)
-                sep = Gtk.Label(label="·")
-                sep.add_css_class("caption")
-                sep.add_css_class("dim-label")
-                status_box.append(sep)
+                time_label.set_label(f"{data.sender_name} · {time_str}")
             time_label.add_css_class("dim-label")
 
-        status_box.append(time_label)
-        bubble.append(status_box)
+        lines.append(time_label)
 
-        outer_box.append(bubble)
-        outer_box.set_hexpand(True)
-        container.append(outer_box)
+        for line, widget in enumerate(lines):
+            bubble.attach(widget, 0, line, 1, 1)
 
-        row.set_child(container)
+        row.set_child(bubble)
         return row
 
     def _go_back_to_list(self) -> None:
         """Navigate back to the chat list."""
         self._nav_view.pop()
         self._selected_chat = None
-        # Focus the list
-        GLib.timeout_add(100, lambda: self._chat_list.grab_focus() or False)
+        # Focus the list once the pop transition has finished
+        self._focus_list_on_show = True
+
+    def _on_list_page_shown(self, _page: Adw.NavigationPage) -> None:
+        """Focus the chat list after navigating back to it."""
+        if self._focus_list_on_show:
+            self._focus_list_on_show = False
+            self._chat_list.grab_focus()
 
     def _on_send_message(self, _widget: Any) -> None:
         """Send a quick reply."""
@@ -1119,40 +1435,23 @@ class SidePanelWindow(Adw.ApplicationWindow):
         chat_guid = self._selected_chat.guid
         self._message_entry.set_text("")
 
-        def send() -> None:
-            async def _send() -> Message | None:
-                client = BlueBubblesClient(
-                    self._config.server_url,  # type: ignore
-                    self._config.password,  # type: ignore
-                )
-                try:
-                    await client.connect()
-                    return await client.send_message(chat_guid, text)
-                except Exception:
-                    return None
-                finally:
-                    await client.close()
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        async def _send() -> Message | None:
+            client = await self.app.get_connected_client()
+            if client is None:
+                return None
             try:
-                msg = loop.run_until_complete(_send())
-                if msg:
-                    def add_message() -> bool:
-                        self._messages.append(msg)
-                        row = self._create_message_row(msg)
-                        self._message_list.append(row)
-                        # Scroll to bottom
-                        adj = self._message_list.get_parent().get_vadjustment()  # type: ignore
-                        if adj:
-                            adj.set_value(adj.get_upper())
-                        return False
-                    GLib.idle_add(add_message)
-            finally:
-                loop.close()
-
-        thread = threading.Thread(target=send, daemon=True)
-        thread.start()
+                return await client.send_message(chat_guid, text)
+            except Exception:
+                return None
+
+        def add_message(msg: Message | None) -> None:
+            if not msg:
+                return
+            # Always jump to our own message, even if scrolled up
+            self._autoscroll = True
+            self._append_message(msg)
+
+        self._run_async(_send(), add_message)
 
 def send_ipc_command(command: str) -> str | None:
     """Send a command to a running panel instance."""
@@ -1160,12 +1459,19 @@ def send_ipc_command(command: str) -> str | None:
         return None
 
     try:
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.connect(str(SOCKET_PATH))
-        sock.send(f"{command}\n".encode())
-        response = sock.recv(1024).decode().strip()
-        sock.close()
-        return response
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            # A hung panel must not stall the caller (e.g. a toggle keybind)
+            sock.settimeout(0.5)
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(f"{command}\n".encode())
+            # Replies are newline-terminated and may span several reads
+            buf = bytearray()
+            while b"\n" not in buf:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                buf.extend(chunk)
+        return buf.decode().strip() or None
     except Exception:
         return None
 
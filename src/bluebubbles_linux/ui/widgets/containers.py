@@ -0,0 +1,28 @@
+"""Helpers for GTK4 container widgets."""
+
+from __future__ import annotations
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+
+from gi.repository import Gtk
+
+
+def remove_all_children(container: Gtk.Widget) -> None:
+    """
+    Remove every child of a Gtk.ListBox or Gtk.Box.
+
+    Uses Gtk.ListBox.remove_all() (GTK 4.12+) when available, which tears
+    the rows down in one pass. Otherwise walks the children once via
+    sibling links instead of re-fetching the first child/row each time.
+    """
+    if hasattr(container, "remove_all"):
+        container.remove_all()
+        return
+
+    child = container.get_first_child()
+    while child is not None:
+        next_child = child.get_next_sibling()
+        container.remove(child)  # type: ignore[attr-defined]
+        child = next_child
@@ -0,0 +1,155 @@
+"""Contact lookup table helpers."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Collection, Iterable, Iterator
+
+from ..api.models import Contact
+from .phone import normalize_phone
+
+
+def _contact_keys(contact: Contact) -> Iterator[str]:
+    """Yield every lookup key for a contact: raw and normalized phones, lowercased emails."""
+    for phone in contact.phones:
+        if addr := phone.get("address"):
+            yield addr
+            yield from normalize_phone(addr)
+    for email in contact.emails:
+        if addr := email.get("address"):
+            yield addr.lower()
+
+
+def canonical_address(address: str) -> str:
+    """
+    Get one representative form of an address.
+
+    Every formatting/country code variant of a phone number maps to the
+    same string, so variants can be compared with a single set lookup.
+    Emails are lowercased.
+    """
+    if "@" in address:
+        return address.lower()
+    return min(normalize_phone(address), default=address)
+
+
+def build_contact_map(contacts: Iterable[Contact]) -> dict[str, str]:
+    """
+    Build an address -> display name mapping for a list of contacts.
+
+    Phone numbers are stored as given plus every normalized variant, so
+    lookups match regardless of formatting or country code. Contacts
+    without a name are skipped; later contacts win on duplicate keys.
+    """
+    contact_map: dict[str, str] = {}
+    for contact in contacts:
+        if name := contact.name:
+            # dict.fromkeys stores every key of a contact in one C-level call
+            contact_map.update(dict.fromkeys(_contact_keys(contact), name))
+    return contact_map
+
+
+def build_contact_index(contacts: dict[str, str]) -> dict[str, str]:
+    """
+    Build an address -> name lookup table keyed by raw and canonical address.
+
+    Every address variant collapses to one canonical key, so a lookup is at
+    most two dict gets (see lookup_contact_name) instead of probing each
+    variant of the queried address.
+
+    Args:
+        contacts: Address -> display name mapping (as from build_contact_map).
+    """
+    index = {canonical_address(address): name for address, name in contacts.items()}
+    # Exact addresses take precedence over a variant that collapsed to the same key
+    index.update(contacts)
+    return index
+
+
+def lookup_contact_name(index: dict[str, str], address: str) -> str | None:
+    """Find the name for an address in a table from build_contact_index."""
+    name = index.get(address)
+    if name is None:
+        name = index.get(canonical_address(address))
+    return name
+
+
+class ContactSearchIndex:
+    """
+    Search index over an address -> name contact mapping.
+
+    Names and addresses are lowercased once when the index is built, and
+    entries are kept sorted by name so prefix matches can be found with
+    a binary search instead of scanning every contact per keystroke.
+    """
+
+    def __init__(self, contacts: dict[str, str]) -> None:
+        """
+        Build the index.
+
+        Args:
+            contacts: Address -> display name mapping (as from build_contact_map).
+        """
+        # (lowercased name, lowercased address, address, name), sorted by name
+        self._entries = sorted(
+            (name.lower(), address.lower(), address, name)
+            for address, name in contacts.items()
+        )
+        # Canonical form per address, used to show a number only once
+        self._canonical = {address: canonical_address(address) for address in contacts}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(
+        self, query: str, exclude: Collection[str] = (), limit: int | None = None
+    ) -> list[tuple[str, str]]:
+        """
+        Find contacts whose name or address contains `query`.
+
+        Name-prefix matches come first (in name order), followed by other
+        substring matches. Each phone number appears once even though the
+        mapping holds several formatting variants of it.
+
+        Args:
+            query: Search text (case-insensitive).
+            exclude: Addresses to leave out (e.g. already selected).
+            limit: Stop searching once this many matches are found.
+
+        Returns:
+            List of (address, name) pairs.
+        """
+        query_lower = query.lower()
+        if not query_lower:
+            return []
+
+        entries = self._entries
+        matches: list[tuple[str, str]] = []
+        seen: set[str] = set()
+
+        def add(entry: tuple[str, str, str, str]) -> None:
+            address = entry[2]
+            canonical = self._canonical[address]
+            if canonical in seen or address in exclude:
+                return
+            matches.append((address, entry[3]))
+            seen.add(canonical)
+
+        # Name-prefix hits are contiguous in sorted order
+        start = end = bisect_left(entries, (query_lower,))
+        while end < len(entries) and entries[end][0].startswith(query_lower):
+            add(entries[end])
+            end += 1
+            if limit is not None and len(matches) >= limit:
+                return matches
+
+        # Then substring matches anywhere in the name or address
+        for i, entry in enumerate(entries):
+            if start <= i < end:
+                continue
+            if query_lower in entry[0] or query_lower in entry[1]:
+                add(entry)
+                if limit is not None and len(matches) >= limit:
+                    break
+
+        return matches
@@ -20,6 +20,10 @@ class Debouncer(Generic[T]):
     This is useful for batching rapid UI updates (e.g., multiple incoming
     messages) into a single update operation.
 
+    With `reset_on_add=False` the debouncer batches over a fixed window
+    instead: the timer starts with the first pending item and is not pushed
+    back by later ones, so a steady stream still fires every `delay_ms`.
+
     Thread-safe: can be called from any thread, callback is invoked on
     the thread that created the debouncer (typically main thread when
     used with GLib.idle_add).
@@ -31,6 +35,7 @@ class Debouncer(Generic[T]):
         delay_ms: int = 100,
         scheduler: Callable[[Callable[[], bool]], int] | None = None,
         cancel_scheduler: Callable[[int], None] | None = None,
+        reset_on_add: bool = True,
     ) -> None:
         """
         Initialize the debouncer.
@@ -43,11 +48,14 @@ class Debouncer(Generic[T]):
                        If None, uses threading.Timer (for testing).
             cancel_scheduler: Function to cancel scheduled callback (e.g., GLib.source_remove).
                               If None, uses Timer.cancel() (for testing).
+            reset_on_add: Restart the timer on every add. If False, the timer
+                          is only started when none is pending.
         """
         self._callback = callback
         self._delay_ms = delay_ms
         self._scheduler = scheduler
         self._cancel_scheduler = cancel_scheduler
+        self._reset_on_add = reset_on_add
 
         self._lock = threading.Lock()
         self._pending_items: list[T] = []
@@ -57,7 +65,7 @@ class Debouncer(Generic[T]):
         """Add an item to the pending batch and reset the timer."""
         with self._lock:
             self._pending_items.append(item)
-            self._reset_timer()
+            self._schedule()
 
     def add_many(self, items: list[T]) -> None:
         """Add multiple items to the pending batch and reset the timer."""
@@ -65,6 +73,11 @@ class Debouncer(Generic[T]):
             return
         with self._lock:
             self._pending_items.extend(items)
+            self._schedule()
+
+    def _schedule(self) -> None:
+        """Start or restart the timer after an add. Must be called with lock held."""
+        if self._reset_on_add or self._timer_id is None:
             self._reset_timer()
 
     def _reset_timer(self) -> None:
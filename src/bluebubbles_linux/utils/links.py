@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import sqlite3
@@ -36,9 +37,9 @@ _preview_cache: dict[str, tuple[LinkPreview, float]] = {}
 CACHE_TTL = 86400  # 24 hours
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreview:
-    """Metadata extracted from a URL."""
+    """Metadata extracted from a URL (slotted; one is cached per previewed URL)."""
     url: str
     title: str | None = None
     description: str | None = None
@@ -266,9 +267,14 @@ async def fetch_link_preview(url: str, timeout: float = 5.0) -> LinkPreview | No
 
     Uses oEmbed for supported sites (TikTok, YouTube, Twitter),
     falls back to HTML meta tag scraping, and caches results.
+
+    The SQLite cache is read and written on the default executor so the
+    event loop (shared with the socket and API requests) never blocks on it.
     """
+    loop = asyncio.get_running_loop()
+
     # Check cache first
-    cached = _get_cached_preview(url)
+    cached = await loop.run_in_executor(None, _get_cached_preview, url)
     if cached:
         return cached
 
@@ -288,6 +294,6 @@ async def fetch_link_preview(url: str, timeout: float = 5.0) -> LinkPreview | No
 
     # Cache the result if we got something useful
     if preview and (preview.title or preview.description):
-        _save_preview_to_cache(preview)
+        await loop.run_in_executor(None, _save_preview_to_cache, preview)
 
     return preview
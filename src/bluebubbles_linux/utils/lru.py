@@ -0,0 +1,96 @@
+"""Bounded LRU cache for expensive-to-build in-memory objects."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Least-recently-used cache bounded by item count and total cost.
+
+    Each entry has a cost (e.g. decoded byte size of an image) computed by
+    `cost_fn` when it is inserted. When either `max_items` or `max_cost` is
+    exceeded, the least recently used entries are evicted until the cache
+    fits again.
+
+    Thread-safe: entries can be inserted from worker threads and read from
+    the main thread.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 128,
+        max_cost: int | None = None,
+        cost_fn: Callable[[V], int] | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_items: Maximum number of entries to keep.
+            max_cost: Maximum total cost of all entries. None means unbounded.
+            cost_fn: Function returning the cost of a value. Defaults to 1 per entry.
+        """
+        self._max_items = max_items
+        self._max_cost = max_cost
+        self._cost_fn = cost_fn or (lambda _value: 1)
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._total_cost = 0
+
+    def get(self, key: K) -> V | None:
+        """Get a value and mark it as most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: K, value: V) -> None:
+        """Insert or replace a value, evicting old entries if needed."""
+        cost = self._cost_fn(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_cost -= old[1]
+            self._entries[key] = (value, cost)
+            self._total_cost += cost
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within bounds. Lock must be held."""
+        while self._entries and (
+            len(self._entries) > self._max_items
+            or (self._max_cost is not None and self._total_cost > self._max_cost)
+        ):
+            _key, (_value, cost) = self._entries.popitem(last=False)
+            self._total_cost -= cost
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._total_cost = 0
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_cost(self) -> int:
+        """Get the combined cost of all cached entries."""
+        with self._lock:
+            return self._total_cost
@@ -0,0 +1,55 @@
+"""Phone number normalization utilities."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+_DIGITS_RE = re.compile(r"[^\d]")
+
+# Deletes every non-digit Latin-1 character (covers formatting like "+1 (555) 123-4567")
+_NON_DIGIT_TABLE = str.maketrans("", "", "".join(chr(c) for c in range(256) if not chr(c).isdigit()))
+
+# Formatting characters people type into phone numbers
+_PHONE_FORMATTING_TABLE = str.maketrans("", "", "+-() ")
+
+
+def looks_like_phone(text: str) -> bool:
+    """Check if text is a phone number, allowing "+", "-", "(", ")" and spaces."""
+    return text.translate(_PHONE_FORMATTING_TABLE).isdigit()
+
+
+@lru_cache(maxsize=4096)
+def normalize_phone(phone: str) -> tuple[str, ...]:
+    """
+    Normalize a phone number for comparison (remove formatting).
+
+    Returns multiple variants to handle country code differences. Results
+    are memoized since the same handful of addresses is looked up for every
+    chat row and message bubble.
+    """
+    # Remove all non-digit characters; translate() handles the common case
+    # without the regex engine, which is only needed for exotic characters
+    digits_only = phone.translate(_NON_DIGIT_TABLE)
+    if not digits_only.isdecimal():
+        digits_only = _DIGITS_RE.sub("", phone)
+
+    if not digits_only:
+        return ()
+
+    # Add the digits-only version
+    variants = [digits_only]
+
+    # If it starts with country code 1 (US/Canada), also try without it
+    if digits_only.startswith("1") and len(digits_only) == 11:
+        variants.append(digits_only[1:])  # Without country code
+
+    # If it's 10 digits, also try with +1 prefix
+    if len(digits_only) == 10:
+        variants.append("1" + digits_only)  # With country code
+        variants.append("+1" + digits_only)  # With + prefix
+
+    # Also add +digits version
+    variants.append("+" + digits_only)
+
+    return tuple(variants)
@@ -0,0 +1,23 @@
+"""Message timestamp formatting."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _format_minute(epoch_minute: int) -> str:
+    """Format a local clock time for a whole minute since the epoch."""
+    return datetime.fromtimestamp(epoch_minute * 60).strftime("%I:%M %p")
+
+
+def format_message_time(timestamp_ms: int) -> str:
+    """
+    Format a BlueBubbles timestamp (milliseconds since epoch) like "03:04 PM".
+
+    Only minutes are shown, so results are cached per minute; messages in
+    a busy conversation share a handful of entries instead of each paying
+    for a datetime and strftime call.
+    """
+    return _format_minute(timestamp_ms // 60000)
@@ -61,6 +61,27 @@ class TestModels:
         assert message.is_from_me is True
         assert message.date_created_dt.year == 2024
 
+    def test_message_associated_target_guid(self) -> None:
+        """Test stripping the part prefix from associated message GUIDs."""
+        base = {"originalROWID": 1, "isFromMe": False, "dateCreated": 1704153600000}
+
+        reaction = Message(
+            guid="r1", associatedMessageGuid="p:0/msg-123", associatedMessageType=2000, **base
+        )
+        assert reaction.associated_target_guid == "msg-123"
+
+        plain = Message(guid="r2", associatedMessageGuid="msg-456", associatedMessageType=2001, **base)
+        assert plain.associated_target_guid == "msg-456"
+
+        nested = Message(guid="r3", associatedMessageGuid="bp:1/a/msg-789", associatedMessageType=2002, **base)
+        assert nested.associated_target_guid == "msg-789"
+
+        assert Message(guid="m1", **base).associated_target_guid is None
+
+        # Copies see the updated field, not a value computed for the original
+        moved = reaction.model_copy(update={"associated_message_guid": "p:0/msg-999"})
+        assert moved.associated_target_guid == "msg-999"
+
     def test_attachment_is_image(self) -> None:
         """Test attachment type detection."""
         data = {
@@ -73,6 +94,15 @@ class TestModels:
         attachment = Attachment(**data)
         assert attachment.is_image is True
         assert attachment.is_video is False
+        assert attachment.kind == "image"
+
+    def test_attachment_kind(self) -> None:
+        """Test attachment kind classification from mime type or UTI."""
+        video = Attachment(originalROWID=1, guid="a1", uti="com.apple.quicktime-movie")
+        assert video.kind == "video"
+
+        other = Attachment(originalROWID=2, guid="a2", mimeType="application/pdf")
+        assert other.kind == "file"
 
     def test_chat_title_with_display_name(self) -> None:
         """Test chat title prioritizes display name."""
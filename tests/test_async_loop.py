@@ -0,0 +1,108 @@
+"""Tests for the background event loop utility."""
+
+import asyncio
+import threading
+
+import pytest
+
+from bluebubbles_linux.utils.async_loop import BackgroundLoop
+
+
+class TestBackgroundLoop:
+    """Test the BackgroundLoop class."""
+
+    def test_run_returns_result(self) -> None:
+        """run() blocks until the coroutine finishes and returns its result."""
+        bg = BackgroundLoop()
+
+        async def add(a: int, b: int) -> int:
+            await asyncio.sleep(0)
+            return a + b
+
+        try:
+            assert bg.run(add(1, 2)) == 3
+        finally:
+            bg.stop()
+
+    def test_run_propagates_exceptions(self) -> None:
+        """Exceptions raised by the coroutine are re-raised by run()."""
+        bg = BackgroundLoop()
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                bg.run(fail())
+        finally:
+            bg.stop()
+
+    def test_reuses_one_loop_and_thread(self) -> None:
+        """Every coroutine runs on the same loop and thread."""
+        bg = BackgroundLoop()
+
+        async def current() -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+            return asyncio.get_running_loop(), threading.current_thread()
+
+        try:
+            first = bg.run(current())
+            second = bg.run(current())
+            assert first == second
+            assert first[1] is not threading.current_thread()
+        finally:
+            bg.stop()
+
+    def test_submit_from_multiple_threads(self) -> None:
+        """Coroutines can be submitted concurrently from worker threads."""
+        bg = BackgroundLoop()
+        results: list[int] = []
+        lock = threading.Lock()
+
+        async def square(n: int) -> int:
+            await asyncio.sleep(0.01)
+            return n * n
+
+        def worker(n: int) -> None:
+            value = bg.run(square(n))
+            with lock:
+                results.append(value)
+
+        try:
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert sorted(results) == [0, 1, 4, 9, 16]
+        finally:
+            bg.stop()
+
+    def test_run_from_loop_thread_raises(self) -> None:
+        """Blocking on the loop from its own thread is rejected instead of deadlocking."""
+        bg = BackgroundLoop()
+
+        async def noop() -> None:
+            return None
+
+        async def nested() -> None:
+            bg.run(noop())
+
+        try:
+            with pytest.raises(RuntimeError):
+                bg.run(nested())
+        finally:
+            bg.stop()
+
+    def test_restarts_after_stop(self) -> None:
+        """The loop is started again on use after stop()."""
+        bg = BackgroundLoop()
+
+        async def value() -> int:
+            return 42
+
+        bg.run(value())
+        bg.stop()
+        try:
+            assert bg.run(value()) == 42
+        finally:
+            bg.stop()
@@ -169,3 +169,92 @@ class TestRowTracking:
 
         row = rows_by_guid.get("nonexistent")
         assert row is None
+
+
+class TestIncrementalRowSync:
+    """Test the incremental row sync used by MainWindow._sync_chat_rows.
+
+    A plain list stands in for the Gtk.ListBox and strings for row widgets.
+    """
+
+    @staticmethod
+    def sync_rows(
+        listbox: list[str], rows_by_guid: dict[str, str], chats: list[str]
+    ) -> tuple[list[str], int]:
+        """Same algorithm as MainWindow._sync_chat_rows.
+
+        Returns the list of created rows and the number of row moves.
+        """
+        created: list[str] = []
+        moves = 0
+
+        wanted = set(chats)
+        for guid in [g for g in rows_by_guid if g not in wanted]:
+            row = rows_by_guid.pop(guid)
+            if row in listbox:
+                listbox.remove(row)
+
+        for index, guid in enumerate(chats):
+            row = rows_by_guid.get(guid)
+            if row is None:
+                row = f"row-{guid}"
+                rows_by_guid[guid] = row
+                listbox.insert(index, row)
+                created.append(row)
+                continue
+
+            if index >= len(listbox) or listbox[index] is not row:
+                if row in listbox:
+                    listbox.remove(row)
+                listbox.insert(index, row)
+                moves += 1
+
+        return created, moves
+
+    def test_initial_sync_creates_all_rows(self) -> None:
+        """An empty list gets one new row per chat."""
+        listbox: list[str] = []
+        rows_by_guid: dict[str, str] = {}
+
+        created, moves = self.sync_rows(listbox, rows_by_guid, ["a", "b", "c"])
+
+        assert listbox == ["row-a", "row-b", "row-c"]
+        assert len(created) == 3
+        assert moves == 0
+
+    def test_unchanged_order_is_noop(self) -> None:
+        """Syncing the same order creates and moves nothing."""
+        listbox: list[str] = []
+        rows_by_guid: dict[str, str] = {}
+        self.sync_rows(listbox, rows_by_guid, ["a", "b", "c"])
+
+        created, moves = self.sync_rows(listbox, rows_by_guid, ["a", "b", "c"])
+
+        assert created == []
+        assert moves == 0
+
+    def test_move_to_top_reuses_rows(self) -> None:
+        """A chat moving to the top reuses every existing row."""
+        listbox: list[str] = []
+        rows_by_guid: dict[str, str] = {}
+        self.sync_rows(listbox, rows_by_guid, ["a", "b", "c", "d"])
+        original = dict(rows_by_guid)
+
+        created, moves = self.sync_rows(listbox, rows_by_guid, ["c", "a", "b", "d"])
+
+        assert listbox == ["row-c", "row-a", "row-b", "row-d"]
+        assert created == []
+        assert moves == 1
+        assert rows_by_guid == original
+
+    def test_new_and_removed_chats(self) -> None:
+        """Only new chats get rows and removed chats lose theirs."""
+        listbox: list[str] = []
+        rows_by_guid: dict[str, str] = {}
+        self.sync_rows(listbox, rows_by_guid, ["a", "b", "c"])
+
+        created, _moves = self.sync_rows(listbox, rows_by_guid, ["d", "a", "c"])
+
+        assert listbox == ["row-d", "row-a", "row-c"]
+        assert created == ["row-d"]
+        assert "b" not in rows_by_guid
@@ -0,0 +1,132 @@
+"""Tests for contact lookup table helpers."""
+
+from bluebubbles_linux.api.models import Contact
+from bluebubbles_linux.utils.contacts import (
+    ContactSearchIndex,
+    build_contact_index,
+    build_contact_map,
+    canonical_address,
+    lookup_contact_name,
+)
+
+
+class TestBuildContactMap:
+    """Test the build_contact_map helper."""
+
+    def test_phone_variants_and_emails(self) -> None:
+        """Phones map raw and normalized forms; emails are lowercased."""
+        contact = Contact(
+            displayName="Jane Doe",
+            phoneNumbers=[{"address": "(415) 555-0100"}],
+            emails=[{"address": "Jane@Example.com"}],
+        )
+
+        contact_map = build_contact_map([contact])
+
+        assert contact_map["(415) 555-0100"] == "Jane Doe"
+        assert contact_map["4155550100"] == "Jane Doe"
+        assert contact_map["+14155550100"] == "Jane Doe"
+        assert contact_map["jane@example.com"] == "Jane Doe"
+        assert "Jane@Example.com" not in contact_map
+
+    def test_skips_unnamed_contacts_and_empty_addresses(self) -> None:
+        """Contacts without a name and blank addresses are ignored."""
+        unnamed = Contact(phoneNumbers=[{"address": "+14155550100"}])
+        blank = Contact(firstName="Bob", phoneNumbers=[{"address": ""}], emails=[{}])
+
+        assert build_contact_map([unnamed, blank]) == {}
+
+    def test_later_contacts_win(self) -> None:
+        """Duplicate addresses resolve to the last contact seen."""
+        first = Contact(firstName="Old", emails=[{"address": "a@b.com"}])
+        second = Contact(firstName="New", emails=[{"address": "a@b.com"}])
+
+        assert build_contact_map([first, second]) == {"a@b.com": "New"}
+
+
+class TestContactSearchIndex:
+    """Test the ContactSearchIndex class."""
+
+    @staticmethod
+    def make_index() -> ContactSearchIndex:
+        contacts = [
+            Contact(displayName="Alice Smith", phoneNumbers=[{"address": "+14155550100"}]),
+            Contact(displayName="Bob Alison", emails=[{"address": "bob@example.com"}]),
+            Contact(displayName="Carol", emails=[{"address": "carol@alpha.io"}]),
+        ]
+        return ContactSearchIndex(build_contact_map(contacts))
+
+    def test_empty_query(self) -> None:
+        """An empty query matches nothing."""
+        assert self.make_index().search("") == []
+
+    def test_prefix_matches_first(self) -> None:
+        """Name-prefix matches are listed before other substring matches."""
+        results = self.make_index().search("al")
+        names = [name for _address, name in results]
+
+        assert names[0] == "Alice Smith"
+        assert set(names[1:]) == {"Bob Alison", "Carol"}
+
+    def test_case_insensitive(self) -> None:
+        """Queries match regardless of case."""
+        assert self.make_index().search("CAROL") == [("carol@alpha.io", "Carol")]
+
+    def test_phone_variants_shown_once(self) -> None:
+        """A phone number stored under several variants is listed once."""
+        results = self.make_index().search("alice")
+        assert len(results) == 1
+        assert results[0][1] == "Alice Smith"
+
+    def test_address_substring(self) -> None:
+        """Addresses are searched as well as names."""
+        assert self.make_index().search("example.com") == [("bob@example.com", "Bob Alison")]
+
+    def test_exclude(self) -> None:
+        """Excluded addresses are left out."""
+        results = self.make_index().search("carol", exclude=["carol@alpha.io"])
+        assert results == []
+
+    def test_limit_stops_early(self) -> None:
+        """No more than `limit` matches are returned, prefix hits first."""
+        results = self.make_index().search("al", limit=1)
+        assert len(results) == 1
+        assert results[0][1] == "Alice Smith"
+
+
+class TestCanonicalAddress:
+    """Test the canonical_address helper."""
+
+    def test_phone_variants_share_canonical_form(self) -> None:
+        """All formatting and country code variants of a number agree."""
+        forms = {"(415) 555-0100", "4155550100", "14155550100", "+14155550100", "+4155550100"}
+        assert len({canonical_address(f) for f in forms}) == 1
+
+    def test_email_lowercased(self) -> None:
+        """Emails are compared case-insensitively."""
+        assert canonical_address("Bob@Example.com") == "bob@example.com"
+
+    def test_other_addresses_unchanged(self) -> None:
+        """Addresses without digits are returned as-is."""
+        assert canonical_address("unknown") == "unknown"
+
+
+class TestContactIndex:
+    """Test build_contact_index and lookup_contact_name."""
+
+    def test_matches_any_phone_formatting(self) -> None:
+        """A number is found however it is formatted."""
+        index = build_contact_index({"+14155550100": "Alice"})
+        assert lookup_contact_name(index, "+14155550100") == "Alice"
+        assert lookup_contact_name(index, "(415) 555-0100") == "Alice"
+        assert lookup_contact_name(index, "14155550100") == "Alice"
+
+    def test_email_case_insensitive(self) -> None:
+        """Emails match regardless of case."""
+        index = build_contact_index({"bob@example.com": "Bob"})
+        assert lookup_contact_name(index, "Bob@Example.com") == "Bob"
+
+    def test_missing_returns_none(self) -> None:
+        """Unknown addresses return None."""
+        index = build_contact_index({"+14155550100": "Alice"})
+        assert lookup_contact_name(index, "+14155550199") is None
@@ -102,6 +102,30 @@ class TestDebouncer:
         assert len(results) == 1
         assert results[0] == ["item1", "item2", "item3"]
 
+    def test_fixed_window_does_not_reset(self) -> None:
+        """With reset_on_add=False a steady stream still fires after the delay."""
+        results: list[list[str]] = []
+        debouncer: Debouncer[str] = Debouncer(
+            callback=lambda items: results.append(items),
+            delay_ms=100,
+            reset_on_add=False,
+        )
+
+        debouncer.add("item1")
+        time.sleep(0.06)
+        debouncer.add("item2")
+        time.sleep(0.08)  # Past the first item's window
+
+        assert len(results) == 1
+        assert results[0] == ["item1", "item2"]
+
+        # A later item starts a fresh window
+        debouncer.add("item3")
+        time.sleep(0.15)
+
+        assert len(results) == 2
+        assert results[1] == ["item3"]
+
     def test_flush_fires_immediately(self) -> None:
         """flush() should fire pending items immediately."""
         results: list[list[str]] = []
@@ -0,0 +1,77 @@
+"""Tests for the LRU cache utility."""
+
+from bluebubbles_linux.utils.lru import LRUCache
+
+
+class TestLRUCache:
+    """Test the LRUCache class."""
+
+    def test_get_missing_returns_none(self) -> None:
+        """Missing keys return None."""
+        cache: LRUCache[str, int] = LRUCache(max_items=2)
+        assert cache.get("missing") is None
+
+    def test_put_and_get(self) -> None:
+        """Stored values can be retrieved."""
+        cache: LRUCache[str, int] = LRUCache(max_items=2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Exceeding max_items evicts the oldest entry."""
+        cache: LRUCache[str, int] = LRUCache(max_items=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+
+        assert "a" not in cache
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_get_refreshes_recency(self) -> None:
+        """Reading an entry protects it from the next eviction."""
+        cache: LRUCache[str, int] = LRUCache(max_items=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+
+    def test_cost_bound(self) -> None:
+        """Entries are evicted when total cost exceeds max_cost."""
+        cache: LRUCache[str, bytes] = LRUCache(max_items=100, max_cost=10, cost_fn=len)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        assert cache.total_cost == 10
+
+        cache.put("c", b"123")
+        assert "a" not in cache
+        assert cache.total_cost == 8
+
+    def test_replace_updates_cost(self) -> None:
+        """Replacing a key does not double count its cost."""
+        cache: LRUCache[str, bytes] = LRUCache(max_items=10, max_cost=100, cost_fn=len)
+        cache.put("a", b"1234")
+        cache.put("a", b"12")
+        assert cache.total_cost == 2
+        assert len(cache) == 1
+
+    def test_oversized_entry_not_kept(self) -> None:
+        """An entry larger than max_cost is dropped immediately."""
+        cache: LRUCache[str, bytes] = LRUCache(max_items=10, max_cost=4, cost_fn=len)
+        cache.put("big", b"123456")
+        assert "big" not in cache
+        assert cache.total_cost == 0
+
+    def test_clear(self) -> None:
+        """clear() removes everything."""
+        cache: LRUCache[str, int] = LRUCache(max_items=10)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.total_cost == 0
@@ -0,0 +1,55 @@
+"""Tests for phone number normalization."""
+
+from bluebubbles_linux.utils.phone import looks_like_phone, normalize_phone
+
+
+class TestNormalizePhone:
+    """Test the normalize_phone helper."""
+
+    def test_formatted_us_number(self) -> None:
+        """Formatting is stripped and country code variants are added."""
+        assert normalize_phone("(415) 555-0100") == (
+            "4155550100",
+            "14155550100",
+            "+14155550100",
+            "+4155550100",
+        )
+
+    def test_number_with_country_code(self) -> None:
+        """11-digit US numbers also get a variant without the country code."""
+        assert normalize_phone("+14155550100") == (
+            "14155550100",
+            "4155550100",
+            "+14155550100",
+        )
+
+    def test_email_has_no_variants(self) -> None:
+        """Addresses without digits produce no variants."""
+        assert normalize_phone("someone@example.com") == ()
+
+    def test_results_are_memoized(self) -> None:
+        """Repeated lookups return the cached tuple."""
+        first = normalize_phone("+1 (339) 555-0199")
+        second = normalize_phone("+1 (339) 555-0199")
+        assert first is second
+
+    def test_non_latin1_formatting_is_stripped(self) -> None:
+        """Characters outside Latin-1 (e.g. bidi marks) are stripped too."""
+        assert normalize_phone("‪+1 415-555-0100‬") == normalize_phone("+14155550100")
+
+
+class TestLooksLikePhone:
+    """Test the looks_like_phone helper."""
+
+    def test_formatted_numbers(self) -> None:
+        """Digits with common phone formatting are accepted."""
+        assert looks_like_phone("4155550100")
+        assert looks_like_phone("+1 (415) 555-0100")
+
+    def test_non_phone_text(self) -> None:
+        """Names, emails and bare formatting are rejected."""
+        assert not looks_like_phone("")
+        assert not looks_like_phone("+ ()")
+        assert not looks_like_phone("alice")
+        assert not looks_like_phone("555.0100")
+        assert not looks_like_phone("someone@example.com")
@@ -0,0 +1,20 @@
+"""Tests for message time formatting."""
+
+from datetime import datetime
+
+from bluebubbles_linux.utils.timefmt import format_message_time
+
+
+class TestFormatMessageTime:
+    """Test the format_message_time function."""
+
+    def test_matches_strftime(self) -> None:
+        """Output matches formatting the datetime directly."""
+        ts = 1_700_000_123_456
+        expected = datetime.fromtimestamp(ts / 1000).strftime("%I:%M %p")
+        assert format_message_time(ts) == expected
+
+    def test_same_minute_same_string(self) -> None:
+        """Timestamps within one minute format identically."""
+        start = 1_700_000_040_000  # Whole minute
+        assert format_message_time(start) == format_message_time(start + 59_999)